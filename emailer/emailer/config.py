@@ -1,5 +1,7 @@
 """Configuration settings for emailer service."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -54,6 +56,7 @@ class Settings(BaseSettings):
     default_tag: str = "highlights"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get settings instance."""
+    """Get settings instance (parsed once per process)."""
     return Settings()
@@ -1,10 +1,11 @@
 """Process episode source emails."""
 
+import asyncio
 import logging
 import time
-from typing import Optional
+from typing import List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-import html2text
 import httpx
 
 from emailer.episode_source_urls import extract_episode_source_urls
@@ -14,9 +15,38 @@ from emailer.job_processor import JobResult
 
 logger = logging.getLogger(__name__)
 
+# Query parameters added by newsletters/trackers that don't identify an episode
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid"}
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize a URL for deduplication (lowercase host, no fragment or tracking params)."""
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def _dedupe_urls(urls: List[str]) -> List[str]:
+    """Drop URLs that canonicalize to one already seen, keeping the first original."""
+    seen = set()
+    unique = []
+    for url in urls:
+        key = _canonical_url(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(url)
+    return unique
+
 
 def _html_to_plain_text(html_content: str) -> str:
     """Convert HTML to readable plain text."""
+    # Deferred import: only HTML-only emails need the conversion
+    import html2text
+
     h = html2text.HTML2Text()
     h.ignore_links = False
     h.ignore_images = True
@@ -45,15 +75,14 @@ class EpisodeSourceProcessor:
         """
         job_start = time.monotonic()
 
-        # Extract URLs from both text and HTML
-        urls = []
-        if email.body_text:
-            urls.extend(extract_episode_source_urls(email.body_text, is_html=False))
-        if email.body_html:
-            urls.extend(extract_episode_source_urls(email.body_html, is_html=True))
+        # Extract URLs from both text and HTML in one pass
+        urls = await extract_episode_source_urls(
+            text=email.body_text, html=email.body_html
+        )
 
-        # Deduplicate while preserving order
-        urls = list(dict.fromkeys(urls))
+        # Deduplicate on canonical form while preserving order, so the
+        # text and HTML copies of a tracked link are only tried once
+        urls = _dedupe_urls(urls)
 
         if not urls:
             return JobResult(
@@ -119,17 +148,15 @@ class EpisodeSourceProcessor:
                     error=result.error or "Transcription failed",
                 )
 
-            # Get transcript
-            current_step = "fetching transcript"
-            logger.info(f"[episode-source] Step 3/5: Fetching transcript for {transcription_id}")
-            transcript = await self.frontend.get_transcript_text(transcription_id)
-
-            # Generate summary
-            current_step = "generating summary"
-            logger.info(f"[episode-source] Step 4/5: Generating summary for {transcription_id}")
-            summary = await self.frontend.generate_summary(
-                transcription_id,
-                system_prompt_suffix=HTML_SUMMARY_SUFFIX,
+            # Get transcript and generate summary (independent, so run together)
+            current_step = "fetching transcript and generating summary"
+            logger.info(f"[episode-source] Steps 3-4/5: Fetching transcript and generating summary for {transcription_id}")
+            transcript, summary = await asyncio.gather(
+                self.frontend.get_transcript_text(transcription_id),
+                self.frontend.generate_summary(
+                    transcription_id,
+                    system_prompt_suffix=HTML_SUMMARY_SUFFIX,
+                ),
             )
 
             # Store episode source record
@@ -210,10 +237,12 @@ class EpisodeSourceProcessor:
                 error=result.error or "Transcription failed",
             )
 
-        transcript = await self.frontend.get_transcript_text(transcription_id)
-        summary = await self.frontend.generate_summary(
-            transcription_id,
-            system_prompt_suffix=HTML_SUMMARY_SUFFIX,
+        transcript, summary = await asyncio.gather(
+            self.frontend.get_transcript_text(transcription_id),
+            self.frontend.generate_summary(
+                transcription_id,
+                system_prompt_suffix=HTML_SUMMARY_SUFFIX,
+            ),
         )
 
         await self.frontend.create_episode_source(
@@ -1,11 +1,15 @@
 """Extract Apple Podcasts and YouTube URLs from email content."""
 
+import asyncio
 import logging
 import re
-from typing import List
+import time
+from html import unescape
+from typing import List, Optional
+from urllib.parse import urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 logger = logging.getLogger(__name__)
 
@@ -16,24 +20,33 @@ EPISODE_SOURCE_PATTERNS = [
     r"podcasts\.apple\.com/.*[?&]i=\d+",
 ]
 
+# Single alternation so each URL is classified with one regex scan
+EPISODE_SOURCE_PATTERN = re.compile("|".join(EPISODE_SOURCE_PATTERNS), re.IGNORECASE)
+
 # Link text patterns that suggest the href may redirect to a matching URL
 LINK_TEXT_HINTS = [
     re.compile(r"apple\s*podcasts?", re.IGNORECASE),
     re.compile(r"youtube", re.IGNORECASE),
 ]
 
-URL_PATTERN = re.compile(
-    r"https?://[^\s<>\"'\)\]]+",
-    re.IGNORECASE,
-)
+# http(s) URLs in free text. Each URL is one greedy character-class run, so
+# a scan is linear even over long unbroken runs of URL characters; matches
+# are then checked against EPISODE_SOURCE_PATTERN.
+TEXT_URL_PATTERN = re.compile(r"https?://[^\s<>\"'\)\]]+", re.IGNORECASE)
+
+
+# Host paths every episode source URL contains
+EPISODE_SOURCE_HOSTS = ("youtube.com/", "youtu.be/", "podcasts.apple.com/")
 
 
 def _is_episode_source_url(url: str) -> bool:
     """Check if a URL is an Apple Podcasts or YouTube URL."""
-    for pattern in EPISODE_SOURCE_PATTERNS:
-        if re.search(pattern, url, re.IGNORECASE):
-            return True
-    return False
+    # Most links in a newsletter are on other hosts; rule those out with
+    # substring checks before the case-insensitive pattern search
+    lowered = url.lower()
+    if not any(host in lowered for host in EPISODE_SOURCE_HOSTS):
+        return False
+    return EPISODE_SOURCE_PATTERN.search(url) is not None
 
 
 def _link_text_suggests_episode_source(text: str) -> bool:
@@ -44,61 +57,184 @@ def _link_text_suggests_episode_source(text: str) -> bool:
     return False
 
 
-def _resolve_redirect(url: str) -> str | None:
-    """Follow redirects to get the final URL. Returns None on failure."""
+# HTML bodies larger than this (image-heavy marketing sends) are scanned with
+# the URL regex before falling back to a full BeautifulSoup parse
+MAX_PARSED_HTML_CHARS = 500_000
+
+# Hosts that serve episode pages directly; a non-matching link to them is a
+# show/channel page, not a tracking redirect worth following
+NON_REDIRECT_HOSTS = ("apple.com", "youtube.com", "youtu.be")
+
+
+def _may_redirect_to_episode_source(href: str) -> bool:
+    """Check if an href is an absolute http(s) link that could be a tracking redirect."""
+    parts = urlsplit(href)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return False
+    host = parts.hostname
+    return not any(host == domain or host.endswith("." + domain) for domain in NON_REDIRECT_HOSTS)
+
+
+# Resolved redirect targets, keyed by the original href
+REDIRECT_CACHE_TTL_SECONDS = 24 * 60 * 60
+REDIRECT_CACHE_MAX_SIZE = 1024
+_redirect_cache: dict[str, tuple[float, str]] = {}
+
+_redirect_client: httpx.AsyncClient | None = None
+
+
+def _get_redirect_client() -> httpx.AsyncClient:
+    """Get the shared client used for redirect resolution, creating it lazily."""
+    global _redirect_client
+    if _redirect_client is None or _redirect_client.is_closed:
+        _redirect_client = httpx.AsyncClient(follow_redirects=True, timeout=10.0)
+    return _redirect_client
+
+
+async def aclose_redirect_client() -> None:
+    """Close the shared redirect resolution client."""
+    global _redirect_client
+    if _redirect_client is not None:
+        await _redirect_client.aclose()
+        _redirect_client = None
+
+
+async def _resolve_redirect(url: str) -> str | None:
+    """
+    Follow redirects to get the final URL. Returns None on failure.
+
+    Successful resolutions are cached for REDIRECT_CACHE_TTL_SECONDS, since
+    newsletters repeat the same tracking links across emails.
+    """
+    now = time.monotonic()
+    cached = _redirect_cache.get(url)
+    if cached and cached[0] > now:
+        return cached[1]
+
     try:
-        with httpx.Client(follow_redirects=True, timeout=10.0) as client:
-            response = client.head(url)
-            final_url = str(response.url)
-            if final_url != url:
-                logger.info(f"Resolved redirect: {url} -> {final_url}")
-            return final_url
+        response = await _get_redirect_client().head(url)
+        final_url = str(response.url)
+        if final_url != url:
+            logger.info(f"Resolved redirect: {url} -> {final_url}")
+        _redirect_cache.pop(url, None)
+        if len(_redirect_cache) >= REDIRECT_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del _redirect_cache[next(iter(_redirect_cache))]
+        _redirect_cache[url] = (now + REDIRECT_CACHE_TTL_SECONDS, final_url)
+        return final_url
     except Exception as e:
         logger.warning(f"Failed to resolve redirect for {url}: {e}")
         return None
 
 
-def extract_episode_source_urls(body: str, is_html: bool = False) -> List[str]:
+def _add_text_urls(text: str, urls: dict[str, None]) -> None:
+    """Add qualifying URLs found in free text to urls."""
+    # Newsletter text rarely spells out raw URLs (they live in <a> hrefs),
+    # and more rarely still one of ours, so skip the case-insensitive regex
+    # scan unless plain substring checks find a URL on a matching host.
+    if "://" not in text:
+        return
+    lowered = text.lower()
+    if not any(host in lowered for host in EPISODE_SOURCE_HOSTS):
+        return
+    for match in TEXT_URL_PATTERN.finditer(text):
+        url = match.group()
+        if _is_episode_source_url(url):
+            urls[url.rstrip(".,;:!?)")] = None
+
+
+def _scan_html(html: str, collect_text: bool) -> tuple[list[str], list[str], str]:
+    """
+    Parse an HTML body and collect its links and, optionally, its text.
+
+    Args:
+        html: HTML body of the email
+        collect_text: Whether to also return the text content
+
+    Returns:
+        Tuple of (episode source hrefs, redirect hrefs whose link text
+        suggests an episode source, text content or "")
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    # Walk the tree once, collecting anchors and (when asked) the same text
+    # nodes that soup.get_text() would join.
+    text_types = soup.interesting_string_types if collect_text else ()
+    text_parts = []
+    href_urls = []
+    redirect_hrefs = []
+    for node in soup.descendants:
+        if type(node) in text_types:
+            text_parts.append(node)
+            continue
+        if not isinstance(node, Tag) or node.name != "a":
+            continue
+        href = node.get("href")
+        if href is None:
+            continue
+        if _is_episode_source_url(href):
+            href_urls.append(href)
+        elif _may_redirect_to_episode_source(href) and _link_text_suggests_episode_source(node.get_text()):
+            # Link text says "Apple Podcasts" or "YouTube" but href
+            # is a redirect (e.g. Substack, Mailchimp tracking links)
+            redirect_hrefs.append(href)
+    return href_urls, redirect_hrefs, "".join(text_parts)
+
+
+async def extract_episode_source_urls(
+    text: Optional[str] = None,
+    html: Optional[str] = None,
+) -> List[str]:
     """
     Extract Apple Podcasts and YouTube URLs from email content.
 
-    For HTML content, if a link's text suggests it points to Apple Podcasts
-    or YouTube but the href is a redirect URL, the redirect is followed
-    to resolve the actual destination.
+    The HTML part's links are scanned, and if a link's text suggests it
+    points to Apple Podcasts or YouTube but the href is a redirect URL, the
+    redirect is followed to resolve the actual destination. Redirects are
+    resolved concurrently. Plain-text URLs are scanned once, in the text part
+    when present and otherwise in the HTML part's text content. HTML parts
+    over MAX_PARSED_HTML_CHARS are regex-scanned first and only parsed if
+    that finds nothing.
 
     Args:
-        body: Email body content
-        is_html: Whether the body is HTML
+        text: Plain text body of the email
+        html: HTML body of the email
 
     Returns:
-        List of unique matching URLs
+        Unique matching URLs, in the order they were found
     """
-    if not body:
-        return []
-
-    urls = set()
-
-    if is_html:
-        soup = BeautifulSoup(body, "html.parser")
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if _is_episode_source_url(href):
-                urls.add(href)
-            elif _link_text_suggests_episode_source(link.get_text()):
-                # Link text says "Apple Podcasts" or "YouTube" but href
-                # is a redirect (e.g. Substack, Mailchimp tracking links)
-                resolved = _resolve_redirect(href)
+    # Insertion-ordered, so duplicates are dropped as they are found and
+    # callers trying URLs in turn see them in a stable, discovery order
+    urls: dict[str, None] = {}
+    scan_text = text
+
+    if html and len(html) > MAX_PARSED_HTML_CHARS:
+        # Hrefs and text are both visible to the regex in the raw markup, so
+        # only build the DOM if that finds nothing and link-text hints may
+        # still need resolving.
+        _add_text_urls(unescape(html), urls)
+        if urls:
+            html = None
+
+    if html:
+        # Parsing a large newsletter takes tens of milliseconds, so keep it
+        # off the event loop
+        href_urls, redirect_hrefs, html_text = await asyncio.to_thread(
+            _scan_html, html, not text
+        )
+        urls.update(dict.fromkeys(href_urls))
+        if redirect_hrefs:
+            # Newsletters often repeat the same tracking link (header, body,
+            # footer); resolve each distinct href once.
+            resolved_urls = await asyncio.gather(
+                *(_resolve_redirect(href) for href in dict.fromkeys(redirect_hrefs))
+            )
+            for resolved in resolved_urls:
                 if resolved and _is_episode_source_url(resolved):
-                    urls.add(resolved)
-        text = soup.get_text()
-        for match in URL_PATTERN.findall(text):
-            clean_url = match.rstrip(".,;:!?)")
-            if _is_episode_source_url(clean_url):
-                urls.add(clean_url)
-    else:
-        for match in URL_PATTERN.findall(body):
-            clean_url = match.rstrip(".,;:!?)")
-            if _is_episode_source_url(clean_url):
-                urls.add(clean_url)
+                    urls[resolved] = None
+        if not text:
+            scan_text = html_text
+
+    if scan_text:
+        _add_text_urls(scan_text, urls)
 
     return list(urls)
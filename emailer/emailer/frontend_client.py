@@ -1,5 +1,7 @@
 """Client for frontend API communication."""
 
+import asyncio
+import json
 import logging
 import time
 from dataclasses import dataclass
@@ -9,9 +11,28 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+TERMINAL_STATUSES = ("completed", "failed")
+
+# Default limit on how long to wait for a transcription to finish
+WAIT_MAX_SECONDS = 3600.0
+
+# Tag lists and tag configs change rarely; reuse them across the emails of a poll
+TAG_CACHE_TTL_SECONDS = 60.0
+
+# Body of the events route's own 404, as opposed to the route being missing
+TRANSCRIPTION_NOT_FOUND = {"detail": "Transcription not found"}
+
 HTML_SUMMARY_SUFFIX = """Format your response using valid HTML elements (headings, paragraphs, lists, tables, etc.). Do not include <html>, <head>, or <body> tags - only the inner content."""
 
 
+def _is_transcription_not_found(response: httpx.Response) -> bool:
+    """Whether a 404 names an unknown transcription rather than a missing route."""
+    try:
+        return response.json() == TRANSCRIPTION_NOT_FOUND
+    except ValueError:
+        return False
+
+
 @dataclass
 class TranscriptionResult:
     """Result from a transcription job."""
@@ -31,6 +52,28 @@ class FrontendClient:
     def __init__(self, base_url: str, timeout: float = 120.0):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        # Cleared once the frontend reports it has no events endpoint
+        self._events_supported = True
+        # Cached (expiry, value) pairs for get_tags / get_tag_config
+        self._tags_cache: Optional[tuple[float, set[str]]] = None
+        self._tag_config_cache: dict[str, tuple[float, dict | None]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections alive across calls instead of
+        paying a new TCP/TLS handshake for every request and poll.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def submit_url(self, url: str, tag: str | None = None) -> str:
         """
@@ -48,63 +91,79 @@ class FrontendClient:
         """
         logger.debug(f"POST /api/transcribe starting for {url}")
         start = time.monotonic()
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload = {"url": url}
-            if tag:
-                payload["tags"] = [tag]
-            response = await client.post(
-                f"{self.base_url}/api/transcribe",
-                json=payload,
-            )
-            elapsed = time.monotonic() - start
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"Submitted URL for transcription: {url} -> {data['id']} ({elapsed:.2f}s)")
-            return data["id"]
+        client = self._get_client()
+        payload = {"url": url}
+        if tag:
+            payload["tags"] = [tag]
+        response = await client.post(
+            f"{self.base_url}/api/transcribe",
+            json=payload,
+        )
+        elapsed = time.monotonic() - start
+        response.raise_for_status()
+        data = response.json()
+        logger.info(f"Submitted URL for transcription: {url} -> {data['id']} ({elapsed:.2f}s)")
+        return data["id"]
 
     async def get_tags(self) -> set[str]:
         """
         Fetch available tags from frontend config.
 
+        Results are cached for TAG_CACHE_TTL_SECONDS.
+
         Returns:
             Set of tag names
 
         Raises:
             httpx.HTTPStatusError: If the request fails
         """
+        now = time.monotonic()
+        if self._tags_cache and self._tags_cache[0] > now:
+            return set(self._tags_cache[1])
+
         logger.debug("GET /api/config/tags starting")
         start = time.monotonic()
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/api/config/tags")
-            elapsed = time.monotonic() - start
-            response.raise_for_status()
-            data = response.json()
-            logger.debug(f"GET /api/config/tags completed ({elapsed:.2f}s)")
-            return set(data.get("tags", {}).keys())
+        client = self._get_client()
+        response = await client.get(f"{self.base_url}/api/config/tags")
+        elapsed = time.monotonic() - start
+        response.raise_for_status()
+        data = response.json()
+        logger.debug(f"GET /api/config/tags completed ({elapsed:.2f}s)")
+        tags = set(data.get("tags", {}).keys())
+        self._tags_cache = (now + TAG_CACHE_TTL_SECONDS, tags)
+        return set(tags)
 
     async def get_tag_config(self, tag_name: str) -> dict | None:
         """
         Fetch configuration for a specific tag.
 
+        Results, including "not found", are cached for TAG_CACHE_TTL_SECONDS.
+
         Args:
             tag_name: Name of the tag to fetch config for
 
         Returns:
             Tag configuration dict or None if tag not found
         """
-        logger.debug(f"GET /api/tags/{tag_name} starting")
         start = time.monotonic()
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(f"{self.base_url}/api/tags/{tag_name}")
-                elapsed = time.monotonic() - start
-                response.raise_for_status()
-                logger.debug(f"GET /api/tags/{tag_name} completed ({elapsed:.2f}s)")
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
+        cached = self._tag_config_cache.get(tag_name)
+        if cached and cached[0] > start:
+            return cached[1]
+
+        logger.debug(f"GET /api/tags/{tag_name} starting")
+        client = self._get_client()
+        try:
+            response = await client.get(f"{self.base_url}/api/tags/{tag_name}")
+            elapsed = time.monotonic() - start
+            response.raise_for_status()
+            logger.debug(f"GET /api/tags/{tag_name} completed ({elapsed:.2f}s)")
+            config = response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
                 raise
+            config = None
+        self._tag_config_cache[tag_name] = (start + TAG_CACHE_TTL_SECONDS, config)
+        return config
 
     async def get_transcription(self, transcription_id: str) -> TranscriptionResult:
         """
@@ -118,39 +177,61 @@ class FrontendClient:
         """
         logger.debug(f"GET /api/transcriptions/{transcription_id} starting")
         start = time.monotonic()
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/api/transcriptions/{transcription_id}"
-            )
-            elapsed = time.monotonic() - start
-            response.raise_for_status()
-            data = response.json()
-            logger.debug(f"GET /api/transcriptions/{transcription_id} completed: status={data['status']} ({elapsed:.2f}s)")
+        client = self._get_client()
+        response = await client.get(
+            f"{self.base_url}/api/transcriptions/{transcription_id}"
+        )
+        elapsed = time.monotonic() - start
+        response.raise_for_status()
+        data = response.json()
+        logger.debug(f"GET /api/transcriptions/{transcription_id} completed: status={data['status']} ({elapsed:.2f}s)")
+
+        result = TranscriptionResult(
+            transcription_id=data["id"],
+            status=data["status"],
+        )
 
-            result = TranscriptionResult(
-                transcription_id=data["id"],
-                status=data["status"],
-            )
+        # Extract source info if available
+        if "source" in data:
+            result.title = data["source"].get("title")
 
-            # Extract source info if available
-            if "source" in data:
-                result.title = data["source"].get("title")
+        # Extract source_context if available
+        result.source_context = data.get("source_context")
 
-            # Extract source_context if available
-            result.source_context = data.get("source_context")
+        # Extract transcription data if completed
+        if "transcription" in data and data["transcription"]:
+            result.full_text = data["transcription"].get("full_text")
+            duration = data["transcription"].get("duration")
+            if duration:
+                result.duration_seconds = int(duration)
 
-            # Extract transcription data if completed
-            if "transcription" in data and data["transcription"]:
-                result.full_text = data["transcription"].get("full_text")
-                duration = data["transcription"].get("duration")
-                if duration:
-                    result.duration_seconds = int(duration)
+        # Extract error if failed
+        if data["status"] == "failed":
+            result.error = data.get("error", "Unknown error")
 
-            # Extract error if failed
-            if data["status"] == "failed":
-                result.error = data.get("error", "Unknown error")
+        return result
+
+    async def get_transcription_status(self, transcription_id: str) -> str:
+        """
+        Get only the status of a transcription.
 
-            return result
+        Args:
+            transcription_id: ID of the transcription
+
+        Returns:
+            Current status string
+        """
+        logger.debug(f"GET /api/transcriptions/{transcription_id}/status starting")
+        start = time.monotonic()
+        client = self._get_client()
+        response = await client.get(
+            f"{self.base_url}/api/transcriptions/{transcription_id}/status"
+        )
+        elapsed = time.monotonic() - start
+        response.raise_for_status()
+        status = response.json()["status"]
+        logger.debug(f"GET /api/transcriptions/{transcription_id}/status completed: status={status} ({elapsed:.2f}s)")
+        return status
 
     async def get_transcript_text(self, transcription_id: str) -> str:
         """
@@ -164,14 +245,14 @@ class FrontendClient:
         """
         logger.debug(f"GET /api/transcriptions/{transcription_id}/export/txt starting")
         start = time.monotonic()
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/api/transcriptions/{transcription_id}/export/txt"
-            )
-            elapsed = time.monotonic() - start
-            response.raise_for_status()
-            logger.debug(f"GET /api/transcriptions/{transcription_id}/export/txt completed ({elapsed:.2f}s)")
-            return response.text
+        client = self._get_client()
+        response = await client.get(
+            f"{self.base_url}/api/transcriptions/{transcription_id}/export/txt"
+        )
+        elapsed = time.monotonic() - start
+        response.raise_for_status()
+        logger.debug(f"GET /api/transcriptions/{transcription_id}/export/txt completed ({elapsed:.2f}s)")
+        return response.text
 
     async def generate_summary(
         self,
@@ -193,20 +274,21 @@ class FrontendClient:
         """
         logger.debug(f"POST /api/summaries starting for {transcription_id}")
         start = time.monotonic()
-        async with httpx.AsyncClient(timeout=360.0) as client:  # Longer timeout for LLM (must exceed summarizer's 300s)
-            payload = {"transcription_id": transcription_id}
-            if system_prompt_suffix:
-                payload["system_prompt_suffix"] = system_prompt_suffix
-
-            response = await client.post(
-                f"{self.base_url}/api/summaries",
-                json=payload,
-            )
-            elapsed = time.monotonic() - start
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"Generated summary for {transcription_id} ({elapsed:.2f}s)")
-            return data["summary_text"]
+        client = self._get_client()
+        payload = {"transcription_id": transcription_id}
+        if system_prompt_suffix:
+            payload["system_prompt_suffix"] = system_prompt_suffix
+
+        response = await client.post(
+            f"{self.base_url}/api/summaries",
+            json=payload,
+            timeout=360.0,  # Longer timeout for LLM (must exceed summarizer's 300s)
+        )
+        elapsed = time.monotonic() - start
+        response.raise_for_status()
+        data = response.json()
+        logger.info(f"Generated summary for {transcription_id} ({elapsed:.2f}s)")
+        return data["summary_text"]
 
     async def create_episode_source(
         self,
@@ -234,40 +316,98 @@ class FrontendClient:
         """
         logger.debug(f"POST /api/episode-sources starting for {transcription_id}")
         start = time.monotonic()
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload = {
-                "transcription_id": transcription_id,
-                "source_text": source_text,
-                "matched_url": matched_url,
-            }
-            if email_subject is not None:
-                payload["email_subject"] = email_subject
-            if email_from is not None:
-                payload["email_from"] = email_from
-
-            response = await client.post(
-                f"{self.base_url}/api/episode-sources",
-                json=payload,
+        client = self._get_client()
+        payload = {
+            "transcription_id": transcription_id,
+            "source_text": source_text,
+            "matched_url": matched_url,
+        }
+        if email_subject is not None:
+            payload["email_subject"] = email_subject
+        if email_from is not None:
+            payload["email_from"] = email_from
+
+        response = await client.post(
+            f"{self.base_url}/api/episode-sources",
+            json=payload,
+        )
+        elapsed = time.monotonic() - start
+        response.raise_for_status()
+        data = response.json()
+        logger.info(f"Created episode source {data['id']} for {transcription_id} ({elapsed:.2f}s)")
+        return data["id"]
+
+    async def stream_completion(
+        self,
+        transcription_id: str,
+        max_wait: float = WAIT_MAX_SECONDS,
+    ) -> Optional[TranscriptionResult]:
+        """
+        Wait for a transcription to finish via the server-sent events stream.
+
+        Args:
+            transcription_id: ID of the transcription
+            max_wait: Maximum seconds to wait
+
+        Returns:
+            Final TranscriptionResult, or None if the stream closed before
+            the transcription reached a terminal status
+
+        Raises:
+            httpx.HTTPStatusError: If the events endpoint is unavailable
+            TimeoutError: If max_wait exceeded
+        """
+        url = f"{self.base_url}/api/transcriptions/{transcription_id}/events"
+
+        async def _read_until_terminal() -> Optional[str]:
+            async with self._get_client().stream("GET", url) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    status = json.loads(line[len("data:"):]).get("status")
+                    logger.debug(f"Event for {transcription_id}: status={status}")
+                    if status in TERMINAL_STATUSES:
+                        return status
+            return None
+
+        try:
+            status = await asyncio.wait_for(_read_until_terminal(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Transcription {transcription_id} did not complete within {max_wait:.1f}s"
             )
-            elapsed = time.monotonic() - start
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"Created episode source {data['id']} for {transcription_id} ({elapsed:.2f}s)")
-            return data["id"]
+
+        if status is None:
+            return None
+        return await self.get_transcription(transcription_id)
 
     async def wait_for_completion(
         self,
         transcription_id: str,
         poll_interval: float = 5.0,
-        max_wait: float = 3600.0,
+        max_wait: float = WAIT_MAX_SECONDS,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 1.5,
     ) -> TranscriptionResult:
         """
         Wait for a transcription to complete.
 
+        Completion is awaited on the frontend's event stream when available.
+        Otherwise the lightweight status endpoint is polled: the delay between
+        status checks starts at poll_interval and grows by backoff_factor after
+        each check, capped at max_poll_interval, so long transcriptions are
+        polled far less often than short ones. The full transcription is only
+        fetched once it reaches a terminal status.
+
         Args:
             transcription_id: ID of the transcription
-            poll_interval: Seconds between status checks
+            poll_interval: Seconds before the first re-check
             max_wait: Maximum seconds to wait
+            max_poll_interval: Upper bound on seconds between status checks
+            backoff_factor: Multiplier applied to the delay after each check
 
         Returns:
             Final TranscriptionResult
@@ -275,21 +415,40 @@ class FrontendClient:
         Raises:
             TimeoutError: If max_wait exceeded
         """
-        import asyncio
-
         logger.info(f"Waiting for transcription {transcription_id} (max_wait={max_wait}s)")
         start = time.monotonic()
+
+        if self._events_supported:
+            try:
+                result = await self.stream_completion(transcription_id, max_wait=max_wait)
+                if result is not None:
+                    total_elapsed = time.monotonic() - start
+                    logger.info(f"Transcription {transcription_id} {result.status} after {total_elapsed:.1f}s (event stream)")
+                    return result
+                logger.warning(f"Event stream for {transcription_id} closed early, falling back to polling")
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404 or _is_transcription_not_found(e.response):
+                    raise
+                logger.info("Frontend has no events endpoint, falling back to polling")
+                self._events_supported = False
+            except httpx.TransportError as e:
+                logger.warning(f"Event stream for {transcription_id} failed, falling back to polling: {e}")
+
         poll_count = 0
+        interval = poll_interval
         while (time.monotonic() - start) < max_wait:
             poll_count += 1
-            result = await self.get_transcription(transcription_id)
+            status = await self.get_transcription_status(transcription_id)
 
-            if result.status in ("completed", "failed"):
+            if status in TERMINAL_STATUSES:
+                result = await self.get_transcription(transcription_id)
                 total_elapsed = time.monotonic() - start
                 logger.info(f"Transcription {transcription_id} {result.status} after {total_elapsed:.1f}s ({poll_count} polls)")
                 return result
 
-            await asyncio.sleep(poll_interval)
+            remaining = max_wait - (time.monotonic() - start)
+            await asyncio.sleep(max(0.0, min(interval, remaining)))
+            interval = min(interval * backoff_factor, max_poll_interval)
 
         total_elapsed = time.monotonic() - start
         raise TimeoutError(
@@ -2,21 +2,52 @@
 
 import asyncio
 import email
+import functools
 import imaplib
 import logging
 import re
+import select
+import ssl
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from email.header import decode_header
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for blocking IMAP operations
-_executor = ThreadPoolExecutor(max_workers=2)
+# Sessions idle longer than this are checked with NOOP before use; servers
+# such as iCloud drop idle connections after about 30 minutes
+IDLE_NOOP_SECONDS = 25 * 60
 
+# RFC 2177: re-issue IDLE before the server's 30 minute inactivity timeout
+IDLE_TIMEOUT_SECONDS = 29 * 60
 
-@dataclass
+# How often a blocked IDLE checks whether it has been asked to stop
+IDLE_STOP_CHECK_SECONDS = 1.0
+
+# Messages per FETCH command; keeps the command line well under server limits
+FETCH_BATCH_SIZE = 100
+
+# Sequence number at the start of a FETCH response, e.g. b"12 (BODY[] {3456}"
+FETCH_MSG_NUM_PATTERN = re.compile(rb"^(\d+) ")
+
+
+@functools.lru_cache(maxsize=2048)
+def _decode_subject(raw_subject: str) -> str:
+    """Decode an RFC 2047 encoded Subject header."""
+    # Plain subjects have no encoded words; skip decode_header entirely
+    if "=?" not in raw_subject:
+        return raw_subject
+    decoded_parts = decode_header(raw_subject)
+    return "".join(
+        part.decode(charset or "utf-8") if isinstance(part, bytes) else part
+        for part, charset in decoded_parts
+    )
+
+
+@dataclass(slots=True)
 class EmailMessage:
     """Represents an email message."""
 
@@ -44,11 +75,27 @@ class ImapClient:
         self.password = password
         self.use_ssl = use_ssl
         self._client: Optional[imaplib.IMAP4_SSL | imaplib.IMAP4] = None
+        self._last_activity: Optional[float] = None
+        # Whether the server supports RFC 6851 MOVE / RFC 2177 IDLE (set on connect)
+        self._has_move = False
+        self._has_idle = False
+        self._selected_folder: Optional[str] = None
+        # One thread per session: an imaplib connection carries one command
+        # at a time, and a blocked IDLE must not stall other sessions
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._idle_stop = threading.Event()
+
+    @property
+    def supports_idle(self) -> bool:
+        """Whether the connected server advertises IDLE."""
+        return self._client is not None and self._has_idle
 
     async def _run_sync(self, func, *args):
         """Run a blocking function in thread pool."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(_executor, func, *args)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._executor, func, *args)
+        self._last_activity = time.monotonic()
+        return result
 
     async def connect(self) -> None:
         """Establish connection to IMAP server."""
@@ -58,9 +105,16 @@ class ImapClient:
             else:
                 client = imaplib.IMAP4(self.host, self.port)
             client.login(self.user, self.password)
+            # Servers often advertise extensions such as MOVE only after login
+            status, data = client.capability()
+            if status == "OK" and data and data[-1]:
+                client.capabilities = tuple(data[-1].decode().upper().split())
             return client
 
         self._client = await self._run_sync(_connect)
+        self._has_move = "MOVE" in self._client.capabilities
+        self._has_idle = "IDLE" in self._client.capabilities
+        self._selected_folder = None
         logger.info(f"Connected to IMAP server {self.host}")
 
     async def disconnect(self) -> None:
@@ -71,14 +125,44 @@ class ImapClient:
             except Exception as e:
                 logger.warning(f"Error during IMAP logout: {e}")
             self._client = None
+            self._selected_folder = None
             logger.info("Disconnected from IMAP server")
 
+    def _drop_client(self) -> None:
+        """Close a broken session's socket without logging out, and forget it."""
+        if self._client is not None:
+            try:
+                self._client.shutdown()
+            except Exception as e:
+                logger.debug(f"Error closing IMAP socket: {e}")
+        self._client = None
+        self._selected_folder = None
+
     async def reconnect(self) -> None:
         """Reconnect to IMAP server."""
         logger.info("Reconnecting to IMAP server...")
         await self.disconnect()
         await self.connect()
 
+    async def ensure_connected(self) -> None:
+        """
+        Make sure the session is usable, reconnecting only if it has dropped.
+
+        Sessions used within IDLE_NOOP_SECONDS are assumed alive; older ones
+        are probed with NOOP so a dropped connection is replaced before use.
+        """
+        if self._client is None:
+            await self.connect()
+            return
+        if self._last_activity is not None and time.monotonic() - self._last_activity < IDLE_NOOP_SECONDS:
+            return
+        try:
+            await self._run_sync(self._client.noop)
+        except Exception as e:
+            logger.warning(f"IMAP session check failed, reconnecting: {e}")
+            self._drop_client()
+            await self.connect()
+
     def is_connection_error(self, error: Exception) -> bool:
         """Check if an exception indicates a dead connection."""
         error_str = str(error).lower()
@@ -94,10 +178,100 @@ class ImapClient:
         return any(err in error_str for err in connection_errors)
 
     async def select_folder(self, folder: str) -> None:
-        """Select an IMAP folder."""
+        """Select an IMAP folder, or just sync it if it is already selected."""
+        if folder == self._selected_folder:
+            # NOOP is enough for the server to report newly arrived messages
+            status, _ = await self._run_sync(self._client.noop)
+            if status == "OK":
+                return
         status, _ = await self._run_sync(self._client.select, folder)
         if status != "OK":
+            self._selected_folder = None
             raise RuntimeError(f"Failed to select folder {folder}")
+        self._selected_folder = folder
+
+    async def idle(self, folder: str, timeout: float = IDLE_TIMEOUT_SECONDS) -> bool:
+        """
+        Wait in IDLE on a folder until new mail arrives.
+
+        Args:
+            folder: Folder to watch
+            timeout: Seconds to wait before ending IDLE without new mail
+
+        Returns:
+            True if the server reported new messages since the last
+            fetch_unseen(), False on timeout or stop_idle()
+        """
+        # Clear before the first await so a stop_idle() issued while the
+        # folder is being selected is not lost
+        self._idle_stop.clear()
+        await self.select_folder(folder)
+        try:
+            return await self._run_sync(self._idle, timeout)
+        except Exception:
+            # The session may be stuck mid-IDLE; force a fresh connection
+            self._drop_client()
+            raise
+
+    def stop_idle(self) -> None:
+        """Ask a running idle() to finish within IDLE_STOP_CHECK_SECONDS."""
+        self._idle_stop.set()
+
+    @staticmethod
+    def _response_ready(client: imaplib.IMAP4) -> bool:
+        """Check without blocking whether a response line can be read."""
+        # imaplib reads through a buffered file, which may already hold lines
+        # that arrived in the same segment as the last one read; select() on
+        # the socket can't see those. A non-blocking peek returns them, or
+        # pulls in whatever the socket (or TLS layer) has ready.
+        sock = client.sock
+        timeout = sock.gettimeout()
+        sock.settimeout(0)
+        try:
+            return bool(client.file.peek(1))
+        except (BlockingIOError, ssl.SSLWantReadError):
+            return False
+        finally:
+            sock.settimeout(timeout)
+
+    def _idle(self, timeout: float) -> bool:
+        """Run one IDLE command on the selected folder (blocking)."""
+        client = self._client
+        # fetch_unseen() clears EXISTS once its SEARCH has covered it, so one
+        # still here was reported afterwards (by a NOOP, or while the last
+        # batch was being processed) and its mail hasn't been fetched yet
+        if "EXISTS" in client.untagged_responses:
+            return True
+
+        # imaplib has no IDLE command before Python 3.14; drive it by hand
+        tag = client._new_tag()
+        client.send(tag + b" IDLE\r\n")
+        client.tagged_commands[tag] = None
+        while client._get_response():
+            if client.tagged_commands[tag]:
+                typ, data = client._get_tagged_response(tag)
+                raise RuntimeError(f"IDLE rejected: {typ} {data}")
+
+        deadline = time.monotonic() + timeout
+        new_mail = False
+        while not self._idle_stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if not self._response_ready(client):
+                select.select([client.sock], [], [], min(remaining, IDLE_STOP_CHECK_SECONDS))
+                continue
+            client._get_response()
+            if "EXISTS" in client.untagged_responses:
+                new_mail = True
+                break
+
+        client.send(b"DONE\r\n")
+        typ, data = client._get_tagged_response(tag)
+        if typ != "OK":
+            raise RuntimeError(f"IDLE failed: {typ} {data}")
+        # New mail may also be reported just before the server ends IDLE
+        return new_mail or "EXISTS" in client.untagged_responses
 
     async def fetch_unseen(self, folder: str) -> List[EmailMessage]:
         """Fetch unseen emails from a folder."""
@@ -106,60 +280,60 @@ class ImapClient:
         # Search for unseen messages
         status, data = await self._run_sync(self._client.search, None, "UNSEEN")
         if status != "OK":
-            raise RuntimeError(f"IMAP search failed")
+            raise RuntimeError("IMAP search failed")
 
         # Parse message numbers
+        # The SEARCH covers every message reported so far; later EXISTS
+        # responses tell idle() that new mail is waiting
+        self._client.untagged_responses.pop("EXISTS", None)
+
         msg_nums = data[0].decode().split() if data[0] else []
         if not msg_nums:
             return []
 
         logger.info(f"Found {len(msg_nums)} unseen message(s)")
 
-        # Fetch each message
+        # Fetch in batches: one round trip per FETCH_BATCH_SIZE messages
         messages = []
-        for msg_num in msg_nums:
-            msg = await self._fetch_message(msg_num)
-            if msg:
-                messages.append(msg)
+        for i in range(0, len(msg_nums), FETCH_BATCH_SIZE):
+            messages.extend(await self._fetch_messages(msg_nums[i:i + FETCH_BATCH_SIZE]))
 
         return messages
 
-    async def _fetch_message(self, msg_num: str) -> Optional[EmailMessage]:
-        """Fetch a single message by sequence number."""
+    async def _fetch_messages(self, msg_nums: List[str]) -> List[EmailMessage]:
+        """Fetch several messages by sequence number with a single FETCH."""
         # Use BODY[] instead of RFC822 for better compatibility (e.g., iCloud)
         status, data = await self._run_sync(
-            self._client.fetch, msg_num, "(BODY[])"
+            self._client.fetch, ",".join(msg_nums), "(BODY[])"
         )
 
-        if status != "OK" or not data or not data[0]:
-            logger.warning(f"Failed to fetch message {msg_num}")
-            return None
+        if status != "OK" or not data:
+            logger.warning(f"Failed to fetch messages {','.join(msg_nums)}")
+            return []
 
-        # Parse email from response
-        raw_email = None
-        if isinstance(data[0], tuple) and len(data[0]) >= 2:
-            raw_email = data[0][1]
-        elif isinstance(data[0], bytes):
-            raw_email = data[0]
+        # Each message arrives as a (header, raw_email) tuple followed by b")"
+        messages = []
+        for item in data:
+            if not isinstance(item, tuple) or len(item) < 2:
+                continue
+            match = FETCH_MSG_NUM_PATTERN.match(item[0])
+            if not match or not item[1]:
+                logger.warning(f"No email data in FETCH response item {item[0]!r}")
+                continue
+            messages.append(self._parse_message(match.group(1).decode(), item[1]))
 
-        if not raw_email:
-            logger.warning(f"No email data in response for {msg_num}")
-            return None
+        return messages
 
+    def _parse_message(self, msg_num: str, raw_email: bytes) -> EmailMessage:
+        """Parse a raw RFC 822 message into an EmailMessage."""
         msg = email.message_from_bytes(raw_email)
 
         # Get sender from Return-Path (more reliable) or fall back to From
         sender = msg.get("Return-Path", "") or msg.get("From", "")
 
         # Decode subject
-        subject = ""
         raw_subject = msg.get("Subject", "")
-        if raw_subject:
-            decoded_parts = decode_header(raw_subject)
-            subject = "".join(
-                part.decode(charset or "utf-8") if isinstance(part, bytes) else part
-                for part, charset in decoded_parts
-            )
+        subject = _decode_subject(str(raw_subject)) if raw_subject else ""
 
         # Extract body
         body_text = None
@@ -168,6 +342,11 @@ class ImapClient:
         if msg.is_multipart():
             for part in msg.walk():
                 content_type = part.get_content_type()
+                if content_type not in ("text/plain", "text/html"):
+                    continue
+                # Attached text files are not the message body
+                if part.get_content_disposition() == "attachment":
+                    continue
                 if content_type == "text/plain" and body_text is None:
                     payload = part.get_payload(decode=True)
                     if payload:
@@ -176,6 +355,8 @@ class ImapClient:
                     payload = part.get_payload(decode=True)
                     if payload:
                         body_html = payload.decode("utf-8", errors="replace")
+                if body_text is not None and body_html is not None:
+                    break
         else:
             content_type = msg.get_content_type()
             payload = msg.get_payload(decode=True)
@@ -199,17 +380,64 @@ class ImapClient:
         await self._run_sync(self._client.store, msg_num, "+FLAGS", "\\Seen")
         logger.debug(f"Marked message {msg_num} as seen")
 
-    async def move_to_folder(self, msg_num: str, folder: str) -> None:
-        """Move a message to another folder."""
-        # Copy to destination
-        status, _ = await self._run_sync(self._client.copy, msg_num, folder)
-        if status != "OK":
-            raise RuntimeError(f"Failed to copy message to {folder}")
+    async def mark_seen_many(self, msg_nums: List[str]) -> None:
+        """Mark several messages as seen with a single STORE."""
+        if not msg_nums:
+            return
+        await self._run_sync(self._client.store, ",".join(msg_nums), "+FLAGS", "\\Seen")
+        logger.debug(f"Marked {len(msg_nums)} message(s) as seen")
+
+    async def move_to_folder(self, msg_num: str, folder: str, source_folder: str) -> None:
+        """Move a message from source_folder to another folder."""
+        await self.move_many(source_folder, {folder: [msg_num]})
+
+    async def move_many(self, source_folder: str, moves: Dict[str, List[str]]) -> None:
+        """
+        Move messages to folders using one command per folder.
+
+        Sequence numbers shift once messages are expunged, so all folders'
+        messages are copied and flagged before a single EXPUNGE. MOVE (which
+        expunges immediately) is only used when there is one target folder.
+
+        Args:
+            source_folder: Folder the sequence numbers refer to; re-selected
+                if the session had to reconnect
+            moves: Message sequence numbers to move, keyed by target folder
+        """
+        moves = {folder: msg_nums for folder, msg_nums in moves.items() if msg_nums}
+        if not moves:
+            return
+
+        # The session may have sat idle while the messages were being
+        # processed; a fresh session has no folder selected
+        await self.ensure_connected()
+        if self._selected_folder != source_folder:
+            await self.select_folder(source_folder)
+
+        if self._has_move and len(moves) == 1:
+            # Single round trip instead of COPY + STORE + EXPUNGE
+            folder, msg_nums = next(iter(moves.items()))
+            msg_set = ",".join(msg_nums)
+            status, _ = await self._run_sync(
+                self._client._simple_command, "MOVE", msg_set, folder
+            )
+            if status != "OK":
+                raise RuntimeError(f"Failed to move messages to {folder}")
+            logger.debug(f"Moved message(s) {msg_set} to {folder}")
+            return
+
+        # Copy to destinations
+        for folder, msg_nums in moves.items():
+            status, _ = await self._run_sync(self._client.copy, ",".join(msg_nums), folder)
+            if status != "OK":
+                raise RuntimeError(f"Failed to copy messages to {folder}")
 
         # Mark as deleted
-        await self._run_sync(self._client.store, msg_num, "+FLAGS", "\\Deleted")
+        all_msg_nums = ",".join(n for msg_nums in moves.values() for n in msg_nums)
+        await self._run_sync(self._client.store, all_msg_nums, "+FLAGS.SILENT", "\\Deleted")
 
         # Expunge
         await self._run_sync(self._client.expunge)
 
-        logger.debug(f"Moved message {msg_num} to {folder}")
+        for folder, msg_nums in moves.items():
+            logger.debug(f"Moved message(s) {','.join(msg_nums)} to {folder}")
@@ -1,18 +1,33 @@
 """Process transcription jobs from URLs."""
 
+import asyncio
 import logging
+import random
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Awaitable, Callable, List, Optional
 
 import httpx
 
-from emailer.frontend_client import FrontendClient, HTML_SUMMARY_SUFFIX
+from emailer.frontend_client import (
+    FrontendClient,
+    HTML_SUMMARY_SUFFIX,
+    TranscriptionResult,
+    WAIT_MAX_SECONDS,
+)
 
 logger = logging.getLogger(__name__)
 
+# Attempts for frontend calls that fail with network errors or 5xx responses
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 1.0
 
-@dataclass
+# Submitting is not idempotent, so only errors raised before the request
+# could reach the frontend are safe to retry
+SUBMIT_RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+@dataclass(slots=True)
 class JobResult:
     """Result of processing a URL."""
 
@@ -29,8 +44,44 @@ class JobResult:
 class JobProcessor:
     """Process transcription jobs."""
 
-    def __init__(self, frontend_client: FrontendClient):
+    def __init__(self, frontend_client: FrontendClient, max_concurrent_jobs: int = 3):
         self.frontend = frontend_client
+        # Shared by every process_urls() call, so jobs from emails handled in
+        # parallel together stay within max_concurrent_jobs
+        self._job_slots = asyncio.Semaphore(max_concurrent_jobs)
+
+    async def _with_retries(self, func, *args, transport_errors=(httpx.TransportError,), **kwargs):
+        """
+        Call a frontend coroutine, retrying transient failures.
+
+        5xx responses and the network errors in transport_errors are retried
+        up to MAX_ATTEMPTS times with full-jitter exponential backoff; other
+        errors propagate at once.
+        """
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                return await func(*args, **kwargs)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code < 500 or attempt == MAX_ATTEMPTS:
+                    raise
+                error = f"server error {e.response.status_code}"
+            except httpx.TransportError as e:
+                if not isinstance(e, transport_errors) or attempt == MAX_ATTEMPTS:
+                    raise
+                error = f"{type(e).__name__}: {e}"
+            delay = random.uniform(0, RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+            logger.warning(
+                f"Frontend request failed ({error}), retrying in {delay:.1f}s "
+                f"(attempt {attempt}/{MAX_ATTEMPTS})"
+            )
+            await asyncio.sleep(delay)
+
+    async def _wait_for_completion(self, transcription_id: str, deadline: float) -> TranscriptionResult:
+        """Wait for a transcription, allowing only what remains until deadline."""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Transcription {transcription_id} did not complete within {WAIT_MAX_SECONDS:.0f}s")
+        return await self.frontend.wait_for_completion(transcription_id, max_wait=remaining)
 
     async def _process_existing(self, url: str, transcription_id: str) -> JobResult:
         """Process an existing transcription (handle 409 case)."""
@@ -43,14 +94,14 @@ class JobProcessor:
                 error=result.error or "Transcription failed",
             )
 
-        # Get transcript and generate summary
-        logger.info(f"Fetching transcript for: {transcription_id}")
-        transcript = await self.frontend.get_transcript_text(transcription_id)
-
-        logger.info(f"Generating summary for existing: {transcription_id}")
-        summary = await self.frontend.generate_summary(
-            transcription_id,
-            system_prompt_suffix=HTML_SUMMARY_SUFFIX,
+        # Get transcript and generate summary (independent, so run together)
+        logger.info(f"Fetching transcript and generating summary for existing: {transcription_id}")
+        transcript, summary = await asyncio.gather(
+            self.frontend.get_transcript_text(transcription_id),
+            self.frontend.generate_summary(
+                transcription_id,
+                system_prompt_suffix=HTML_SUMMARY_SUFFIX,
+            ),
         )
 
         return JobResult(
@@ -81,12 +132,19 @@ class JobProcessor:
             # Submit for transcription
             current_step = "submitting URL"
             logger.info(f"[{url}] Step 1/4: Submitting URL")
-            transcription_id = await self.frontend.submit_url(url, tag=tag)
+            transcription_id = await self._with_retries(
+                self.frontend.submit_url, url, tag=tag, transport_errors=SUBMIT_RETRYABLE_ERRORS
+            )
 
             # Wait for completion
             current_step = "waiting for transcription"
             logger.info(f"[{url}] Step 2/4: Waiting for transcription {transcription_id}")
-            result = await self.frontend.wait_for_completion(transcription_id)
+            # Retries share one deadline, so a job that keeps stalling holds
+            # the worker for at most WAIT_MAX_SECONDS in total
+            wait_deadline = time.monotonic() + WAIT_MAX_SECONDS
+            result = await self._with_retries(
+                self._wait_for_completion, transcription_id, wait_deadline
+            )
 
             if result.status == "failed":
                 elapsed = time.monotonic() - job_start
@@ -97,16 +155,15 @@ class JobProcessor:
                     error=result.error or "Transcription failed",
                 )
 
-            # Get transcript and generate summary
-            current_step = "fetching transcript"
-            logger.info(f"[{url}] Step 3/4: Fetching transcript for {transcription_id}")
-            transcript = await self.frontend.get_transcript_text(transcription_id)
-
-            current_step = "generating summary"
-            logger.info(f"[{url}] Step 4/4: Generating summary for {transcription_id}")
-            summary = await self.frontend.generate_summary(
-                transcription_id,
-                system_prompt_suffix=HTML_SUMMARY_SUFFIX,
+            # Get transcript and generate summary (independent, so run together)
+            current_step = "fetching transcript and generating summary"
+            logger.info(f"[{url}] Steps 3-4/4: Fetching transcript and generating summary for {transcription_id}")
+            transcript, summary = await asyncio.gather(
+                self.frontend.get_transcript_text(transcription_id),
+                self.frontend.generate_summary(
+                    transcription_id,
+                    system_prompt_suffix=HTML_SUMMARY_SUFFIX,
+                ),
             )
 
             elapsed = time.monotonic() - job_start
@@ -162,3 +219,33 @@ class JobProcessor:
             error_msg = str(e) or f"Unexpected error: {type(e).__name__}"
             logger.error(f"[{url}] Error during '{current_step}' after {elapsed:.1f}s: {error_msg}")
             return JobResult(url=url, success=False, error=error_msg)
+
+    async def process_urls(
+        self,
+        urls: List[str],
+        tag: str | None = None,
+        on_result: Callable[[JobResult], Awaitable[None]] | None = None,
+    ) -> List[JobResult]:
+        """
+        Process several URLs concurrently.
+
+        At most max_concurrent_jobs URLs are in flight at once across all
+        calls.
+
+        Args:
+            urls: URLs to process
+            tag: Optional tag to apply to each transcription
+            on_result: Optional callback awaited with each result as soon as
+                its URL finishes, rather than after the whole batch
+
+        Returns:
+            JobResults in the same order as urls
+        """
+        async def _process(url: str) -> JobResult:
+            async with self._job_slots:
+                result = await self.process_url(url, tag=tag)
+            if on_result is not None:
+                await on_result(result)
+            return result
+
+        return await asyncio.gather(*(_process(url) for url in urls))
@@ -4,10 +4,11 @@ import asyncio
 import html as html_mod
 import logging
 import signal
-from typing import Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 from emailer.config import Settings, get_settings
 from emailer.episode_source_processor import EpisodeSourceProcessor
+from emailer.episode_source_urls import aclose_redirect_client
 from emailer.frontend_client import FrontendClient
 from emailer.imap_client import ImapClient, EmailMessage
 from emailer.job_processor import JobProcessor, JobResult
@@ -26,6 +27,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Queued emails per worker before a poll blocks on enqueueing more
+QUEUE_SLOTS_PER_WORKER = 4
+
+# Processes one email and returns the folder to move it to (None to leave it)
+EmailHandler = Callable[[EmailMessage], Awaitable[Optional[str]]]
+
+
+def _extract_email_urls(email: EmailMessage) -> List[str]:
+    """Extract transcribable URLs from both the text and HTML parts of an email."""
+    # The HTML pass skips URLs the text part already produced, so the result
+    # is already deduplicated
+    urls = []
+    if email.body_text:
+        urls.extend(extract_urls(email.body_text, is_html=False))
+    if email.body_html:
+        urls.extend(extract_urls(email.body_html, is_html=True, seen=set(urls)))
+    return urls
+
 
 class EmailerService:
     """Main emailer service."""
@@ -33,16 +52,24 @@ class EmailerService:
     def __init__(self, settings: Settings):
         self.settings = settings
         self._shutdown_event: Optional[asyncio.Event] = None
-        self.semaphore: Optional[asyncio.Semaphore] = None
-
-        # Initialize clients
-        self.imap = ImapClient(
+        # Fixed pool of max_concurrent_jobs workers fed by a bounded queue
+        self._queue: Optional[
+            asyncio.Queue[Tuple[EmailHandler, EmailMessage, asyncio.Future]]
+        ] = None
+        self._workers: List[asyncio.Task] = []
+
+        # Initialize clients. Each watched folder gets its own IMAP session so
+        # the folder stays selected between polls and sequence-numbered moves
+        # always apply to the folder the message was fetched from.
+        imap_kwargs = dict(
             host=settings.imap_host,
             port=settings.imap_port,
             user=settings.imap_user,
             password=settings.imap_password,
             use_ssl=settings.imap_use_ssl,
         )
+        self.imap = ImapClient(**imap_kwargs)
+        self.episode_imap = ImapClient(**imap_kwargs)
 
         self.smtp = SmtpClient(
             host=settings.smtp_host,
@@ -50,11 +77,16 @@ class EmailerService:
             user=settings.smtp_user,
             password=settings.smtp_password,
             use_tls=settings.smtp_use_tls,
+            # One session per worker so concurrent result emails don't queue
+            pool_size=settings.max_concurrent_jobs,
         )
 
-        frontend = FrontendClient(base_url=settings.frontend_url)
-        self.processor = JobProcessor(frontend_client=frontend)
-        self.episode_source_processor = EpisodeSourceProcessor(frontend_client=frontend)
+        self.frontend = FrontendClient(base_url=settings.frontend_url)
+        self.processor = JobProcessor(
+            frontend_client=self.frontend,
+            max_concurrent_jobs=settings.max_concurrent_jobs,
+        )
+        self.episode_source_processor = EpisodeSourceProcessor(frontend_client=self.frontend)
 
     async def start(self) -> None:
         """Start the emailer service."""
@@ -64,10 +96,11 @@ class EmailerService:
         # asyncio.Event.wait() can be interrupted immediately when set(),
         # unlike asyncio.sleep() which blocks for the full duration.
         self._shutdown_event = asyncio.Event()
-        self.semaphore = asyncio.Semaphore(self.settings.max_concurrent_jobs)
+        self._start_workers()
 
         # Connect to IMAP
         await self.imap.connect()
+        await self.episode_imap.connect()
 
         logger.info(
             f"Monitoring folders: {self.settings.imap_folder_inbox}, "
@@ -76,20 +109,24 @@ class EmailerService:
         )
 
         try:
-            while not self._shutdown_event.is_set():
-                await self._poll_and_process()
-                # Wait for shutdown signal or poll interval (whichever comes first).
-                # Using wait_for with timeout instead of sleep() allows immediate
-                # response to ctrl-c/SIGTERM without waiting for poll interval.
-                try:
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=self.settings.poll_interval_seconds,
-                    )
-                except asyncio.TimeoutError:
-                    pass  # Timeout is expected - continue polling
+            # Each folder polls and waits for new mail on its own session
+            await asyncio.gather(
+                self._watch_folder(
+                    self.imap, self.settings.imap_folder_inbox, self._process_email
+                ),
+                self._watch_folder(
+                    self.episode_imap,
+                    self.settings.imap_folder_episode_sources,
+                    self._process_episode_source_email,
+                ),
+            )
         finally:
+            await self._stop_workers()
             await self.imap.disconnect()
+            await self.episode_imap.disconnect()
+            await self.smtp.disconnect()
+            await self.frontend.aclose()
+            await aclose_redirect_client()
             logger.info("Emailer service stopped.")
 
     async def stop(self) -> None:
@@ -99,56 +136,119 @@ class EmailerService:
         # allowing graceful shutdown without waiting for poll interval.
         self._shutdown_event.set()
 
-    async def _poll_and_process(self) -> None:
-        """Poll for new emails and process them."""
+    async def _watch_folder(
+        self, imap: ImapClient, folder: str, handler: EmailHandler
+    ) -> None:
+        """Poll a folder, then wait for new mail on it, until shutdown."""
+        while not self._shutdown_event.is_set():
+            await self._poll_folder(imap, folder, handler)
+            await self._wait_for_new_mail(imap, folder)
+
+    async def _wait_for_new_mail(self, imap: ImapClient, folder: str) -> None:
+        """
+        Block until new mail may have arrived in a folder or shutdown is requested.
+
+        When the session supports IMAP IDLE the server pushes new-mail
+        notifications, so this returns as soon as the folder changes (or
+        after IDLE_TIMEOUT_SECONDS to re-arm). Otherwise it waits for the
+        poll interval. Either way shutdown interrupts the wait immediately.
+        """
+        if not imap.supports_idle:
+            await self._wait_for_shutdown(self.settings.poll_interval_seconds)
+            return
+
+        shutdown = asyncio.create_task(self._shutdown_event.wait())
+        idle = asyncio.create_task(imap.idle(folder))
+        await asyncio.wait([shutdown, idle], return_when=asyncio.FIRST_COMPLETED)
+
+        # End the IDLE so the session is free for the next poll
+        imap.stop_idle()
+        shutdown.cancel()
         try:
-            # Check main inbox
-            emails = await self.imap.fetch_unseen(self.settings.imap_folder_inbox)
+            await idle
+        except Exception as e:
+            logger.error(f"IMAP IDLE on {folder} failed: {e}")
+            # Don't spin on a failing IDLE; fall back to one poll interval
+            await self._wait_for_shutdown(self.settings.poll_interval_seconds)
+
+    async def _wait_for_shutdown(self, timeout: float) -> None:
+        """Wait for the shutdown signal or timeout, whichever comes first."""
+        # Using wait_for with timeout instead of sleep() allows immediate
+        # response to ctrl-c/SIGTERM without waiting for poll interval.
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass  # Timeout is expected - continue polling
+
+    async def _poll_folder(
+        self, imap: ImapClient, folder: str, handler: EmailHandler
+    ) -> None:
+        """Fetch a folder's new emails and process them on the worker pool."""
+        try:
+            await imap.ensure_connected()
+
+            emails = await imap.fetch_unseen(folder)
             if emails:
-                logger.info(f"Found {len(emails)} new email(s) in {self.settings.imap_folder_inbox}")
+                logger.info(f"Found {len(emails)} new email(s) in {folder}")
 
-            tasks = []
+            await imap.mark_seen_many([email.msg_num for email in emails])
+            loop = asyncio.get_running_loop()
+            done = []
             for email in emails:
-                await self.imap.mark_seen(email.msg_num)
-                task = asyncio.create_task(self._process_email_with_semaphore(email))
-                tasks.append(task)
-
-            # Check episode sources inbox
+                finished = loop.create_future()
+                await self._queue.put((handler, email, finished))
+                done.append(finished)
+
+            # Finish this folder's emails, then file them with one command per
+            # target folder. Moving only after the whole batch also keeps the
+            # batch's sequence numbers valid until the single expunge.
+            targets = await asyncio.gather(*done)
+            moves: Dict[str, List[str]] = {}
+            for email, target in zip(emails, targets):
+                if target:
+                    moves.setdefault(target, []).append(email.msg_num)
             try:
-                es_emails = await self.imap.fetch_unseen(self.settings.imap_folder_episode_sources)
-                if es_emails:
-                    logger.info(f"Found {len(es_emails)} new email(s) in {self.settings.imap_folder_episode_sources}")
-
-                for email in es_emails:
-                    await self.imap.mark_seen(email.msg_num)
-                    task = asyncio.create_task(self._process_episode_source_with_semaphore(email))
-                    tasks.append(task)
+                await imap.move_many(folder, moves)
             except Exception as e:
-                logger.error(f"Error checking episode sources folder: {e}")
-
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+                logger.error(f"Failed to move emails from {folder}: {e}")
 
         except Exception as e:
-            logger.error(f"Error during poll: {e}")
-            if self.imap.is_connection_error(e):
+            logger.error(f"Error polling {folder}: {e}")
+            if imap.is_connection_error(e):
                 try:
-                    await self.imap.reconnect()
+                    await imap.reconnect()
                 except Exception as reconnect_err:
-                    logger.error(f"Reconnection failed: {reconnect_err}")
-
-    async def _process_email_with_semaphore(self, email: EmailMessage) -> None:
-        """Process email with concurrency limit."""
-        async with self.semaphore:
-            await self._process_email(email)
-
-    async def _process_episode_source_with_semaphore(self, email: EmailMessage) -> None:
-        """Process episode source email with concurrency limit."""
-        async with self.semaphore:
-            await self._process_episode_source_email(email)
-
-    async def _process_episode_source_email(self, email: EmailMessage) -> None:
-        """Process a single episode source email."""
+                    logger.error(f"Reconnection for {folder} failed: {reconnect_err}")
+
+    def _start_workers(self) -> None:
+        """Create the email queue and its fixed pool of worker tasks."""
+        worker_count = self.settings.max_concurrent_jobs
+        self._queue = asyncio.Queue(maxsize=QUEUE_SLOTS_PER_WORKER * worker_count)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(worker_count)]
+
+    async def _stop_workers(self) -> None:
+        """Cancel the worker tasks and wait for them to exit."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self) -> None:
+        """Process queued emails one at a time until cancelled."""
+        while True:
+            handler, email, finished = await self._queue.get()
+            target = None
+            try:
+                target = await handler(email)
+            except Exception as e:
+                logger.error(f"Unhandled error processing email {email.msg_num}: {e}")
+            finally:
+                if not finished.done():
+                    finished.set_result(target)
+                self._queue.task_done()
+
+    async def _process_episode_source_email(self, email: EmailMessage) -> str:
+        """Process a single episode source email and return its target folder."""
         logger.info(f"Processing episode source email {email.msg_num} from {email.sender}")
 
         result = await self.episode_source_processor.process_email(email)
@@ -205,31 +305,19 @@ class EmailerService:
             logger.error(f"Failed to send result email for episode source {email.msg_num}: {e}", exc_info=True)
             target_folder = self.settings.imap_folder_episode_sources_error
 
-        try:
-            await self.imap.move_to_folder(email.msg_num, target_folder)
-        except Exception as e:
-            logger.error(
-                f"Failed to move email {email.msg_num} to {target_folder}: {e}"
-            )
+        return target_folder
 
-    async def _process_email(self, email: EmailMessage) -> None:
-        """Process a single email."""
+    async def _process_email(self, email: EmailMessage) -> str:
+        """Process a single email and return its target folder."""
         logger.info(f"Processing email {email.msg_num} from {email.sender}")
 
-        # Extract URLs from both text and HTML
-        urls = []
-        if email.body_text:
-            urls.extend(extract_urls(email.body_text, is_html=False))
-        if email.body_html:
-            urls.extend(extract_urls(email.body_html, is_html=True))
-
-        # Deduplicate
-        urls = list(dict.fromkeys(urls))
+        # Parsing a large HTML body takes tens of milliseconds, so run it in a
+        # thread rather than stalling polling and the other workers
+        urls = await asyncio.to_thread(_extract_email_urls, email)
 
         if not urls:
             # No transcribable URLs found
-            await self._handle_no_urls(email)
-            return
+            return await self._handle_no_urls(email)
 
         # Resolve tag from subject
         try:
@@ -252,28 +340,23 @@ class EmailerService:
         except Exception as e:
             logger.warning(f"Failed to fetch tag config for '{tag}': {e}")
 
-        # Process each URL
-        results = []
-        for url in urls:
-            result = await self.processor.process_url(url, tag=tag)
-            results.append(result)
-            await self._send_result_email(email, result, tag_config=tag_config)
+        # Process URLs concurrently, sending each result email as soon as its
+        # job finishes (sends share the SMTP session pool)
+        results = await self.processor.process_urls(
+            urls,
+            tag=tag,
+            on_result=lambda result: self._send_result_email(email, result, tag_config=tag_config),
+        )
 
-        # Determine final folder and move
+        # Determine final folder
         any_success = any(r.success for r in results)
-        target_folder = (
+        return (
             self.settings.imap_folder_done if any_success
             else self.settings.imap_folder_error
         )
-        try:
-            await self.imap.move_to_folder(email.msg_num, target_folder)
-        except Exception as e:
-            logger.error(
-                f"Failed to move email {email.msg_num} to {target_folder}: {e}"
-            )
 
-    async def _handle_no_urls(self, email: EmailMessage) -> None:
-        """Handle email with no transcribable URLs."""
+    async def _handle_no_urls(self, email: EmailMessage) -> str:
+        """Notify the sender of an email with no transcribable URLs and return its target folder."""
         subject, body = format_no_urls_email()
 
         await self.smtp.send_email(
@@ -283,14 +366,8 @@ class EmailerService:
             body=body,
         )
 
-        try:
-            await self.imap.move_to_folder(email.msg_num, self.settings.imap_folder_error)
-        except Exception as e:
-            logger.error(
-                f"Failed to move email {email.msg_num} to "
-                f"{self.settings.imap_folder_error}: {e}"
-            )
         logger.info(f"No URLs in email {email.msg_num}, notified sender")
+        return self.settings.imap_folder_error
 
     async def _send_result_email(
         self, email: EmailMessage, result: JobResult, tag_config: dict | None = None
@@ -312,14 +389,14 @@ class EmailerService:
             else:
                 recipients = [email.sender]
 
-            for to_addr in recipients:
-                await self.smtp.send_email(
-                    from_addr=self.settings.from_email_address,
-                    to_addr=to_addr,
-                    subject=subject,
-                    body=text_body,
-                    html_body=html_body,
-                )
+            # One message, one SMTP transaction for all recipients
+            await self.smtp.send_email(
+                from_addr=self.settings.from_email_address,
+                to_addr=recipients,
+                subject=subject,
+                body=text_body,
+                html_body=html_body,
+            )
         else:
             subject, body = format_error_email(
                 url=result.url,
@@ -338,8 +415,13 @@ async def main() -> None:
     settings = get_settings()
     service = EmailerService(settings)
 
+    loop = asyncio.get_running_loop()
+    # Python 3.12+: run new tasks eagerly so those that finish without
+    # blocking skip a trip through the event loop
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
     # Handle shutdown signals
-    loop = asyncio.get_event_loop()
 
     def shutdown_handler():
         asyncio.create_task(service.stop())
@@ -350,5 +432,15 @@ async def main() -> None:
     await service.start()
 
 
+def run() -> None:
+    """Run the service, on uvloop's faster event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+        return
+    uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -4,8 +4,6 @@ import html
 from datetime import datetime, timezone
 from typing import Tuple
 
-import html2text
-
 
 def _format_duration(seconds: int) -> str:
     """Format duration in seconds to human-readable string."""
@@ -22,6 +20,8 @@ def _format_duration(seconds: int) -> str:
 
 def _html_to_plain_text(html_content: str) -> str:
     """Convert HTML to readable plain text."""
+    import html2text
+
     h = html2text.HTML2Text()
     h.ignore_links = False
     h.ignore_images = True
@@ -59,7 +59,8 @@ def format_success_email(
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     duration = _format_duration(duration_seconds)
 
-    # Escape transcript for HTML (prevent XSS)
+    # Escape URL and transcript for HTML (prevent XSS)
+    escaped_url = html.escape(url)
     escaped_transcript = html.escape(transcript)
     # Convert newlines to <br> for HTML display
     html_transcript = escaped_transcript.replace("\n", "<br>\n")
@@ -93,7 +94,7 @@ def format_success_email(
 </head>
 <body>
     <div class="metadata">
-        <div><strong>Source:</strong> <a href="{html.escape(url)}">{html.escape(url)}</a></div>
+        <div><strong>Source:</strong> <a href="{escaped_url}">{escaped_url}</a></div>
         <div><strong>Duration:</strong> {duration}</div>
         <div><strong>Transcribed:</strong> {timestamp}</div>
     </div>
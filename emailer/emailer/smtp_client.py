@@ -1,15 +1,27 @@
 """SMTP client for sending emails."""
 
+import asyncio
 import logging
+import time
 from email.message import EmailMessage
+from typing import Optional, Tuple
 
-from aiosmtplib import SMTP
+from aiosmtplib import SMTP, SMTPResponseException, SMTPServerDisconnected
 
 logger = logging.getLogger(__name__)
 
+# Sessions idle longer than this are replaced rather than reused: servers
+# commonly drop idle clients after a few minutes, and a silently dropped
+# connection can stall a send until its timeout
+SESSION_IDLE_TTL_SECONDS = 100.0
+
+# To header for messages with several recipients, which are only named in
+# the SMTP envelope (RFC 5322 empty group)
+UNDISCLOSED_RECIPIENTS = "undisclosed-recipients:;"
+
 
 class SmtpClient:
-    """Async SMTP client for sending emails."""
+    """Async SMTP client that reuses a small pool of authenticated sessions."""
 
     def __init__(
         self,
@@ -18,17 +30,57 @@ class SmtpClient:
         user: str,
         password: str,
         use_tls: bool = True,
+        pool_size: int = 1,
     ):
         self.host = host
         self.port = port
         self.user = user
         self.password = password
         self.use_tls = use_tls
+        # A send is several commands (MAIL/RCPT/DATA), so each session carries
+        # one transaction at a time. Slots hold (session, last used) and start
+        # empty (None); sessions are opened on first use.
+        self.pool_size = pool_size
+        self._sessions: asyncio.Queue[Optional[Tuple[SMTP, float]]] = asyncio.Queue()
+        for _ in range(pool_size):
+            self._sessions.put_nowait(None)
+
+    async def _connect(self) -> SMTP:
+        """Open and log in a new SMTP session."""
+        # Port 587 uses STARTTLS (start_tls=True), port 465 uses implicit TLS (use_tls=True)
+        use_implicit_tls = self.port == 465
+        smtp = SMTP(
+            hostname=self.host,
+            port=self.port,
+            use_tls=use_implicit_tls,
+            start_tls=self.use_tls and not use_implicit_tls,
+        )
+        logger.debug(f"Connecting to SMTP server {self.host}:{self.port}")
+        await smtp.connect()
+        logger.debug("SMTP connected, logging in...")
+        await smtp.login(self.user, self.password)
+        return smtp
+
+    @staticmethod
+    async def _quit(smtp: SMTP) -> None:
+        """Close a session, ignoring errors from an already dead connection."""
+        try:
+            await smtp.quit()
+        except Exception as e:
+            logger.debug(f"SMTP quit failed: {e}")
+
+    async def disconnect(self) -> None:
+        """Close all idle SMTP sessions."""
+        for _ in range(self._sessions.qsize()):
+            slot = self._sessions.get_nowait()
+            if slot is not None:
+                await self._quit(slot[0])
+            self._sessions.put_nowait(None)
 
     async def send_email(
         self,
         from_addr: str,
-        to_addr: str,
+        to_addr: str | list[str],
         subject: str,
         body: str,
         html_body: str | None = None,
@@ -36,9 +88,13 @@ class SmtpClient:
         """
         Send an email.
 
+        Multiple recipients share one message and one SMTP transaction
+        (a single MAIL FROM / DATA with one RCPT TO per address). They are
+        envelope-only, like Bcc, so no recipient sees the others' addresses.
+
         Args:
             from_addr: Sender email address
-            to_addr: Recipient email address
+            to_addr: Recipient email address, or a list of addresses
             subject: Email subject
             body: Email body (plain text)
             html_body: Optional HTML body (creates multipart email)
@@ -46,7 +102,8 @@ class SmtpClient:
         msg = EmailMessage()
         msg["Subject"] = subject
         msg["From"] = from_addr
-        msg["To"] = to_addr
+        recipients = [to_addr] if isinstance(to_addr, str) else list(to_addr)
+        msg["To"] = recipients[0] if len(recipients) == 1 else UNDISCLOSED_RECIPIENTS
 
         # Set plain text as base content
         msg.set_content(body)
@@ -55,23 +112,37 @@ class SmtpClient:
         if html_body:
             msg.add_alternative(html_body, subtype="html")
 
-        # Port 587 uses STARTTLS (start_tls=True), port 465 uses implicit TLS (use_tls=True)
-        use_implicit_tls = self.port == 465
-        smtp = SMTP(
-            hostname=self.host,
-            port=self.port,
-            use_tls=use_implicit_tls,
-            start_tls=self.use_tls and not use_implicit_tls,
-        )
-
+        slot = await self._sessions.get()
+        smtp = None
         try:
-            logger.debug(f"Connecting to SMTP server {self.host}:{self.port}")
-            await smtp.connect()
-            logger.debug("SMTP connected, logging in...")
-            await smtp.login(self.user, self.password)
-            await smtp.send_message(msg)
-
-            logger.info(f"Sent email to {to_addr}: {subject}")
+            if slot is not None:
+                smtp, last_used = slot
+                if not smtp.is_connected:
+                    smtp = None
+                elif time.monotonic() - last_used > SESSION_IDLE_TTL_SECONDS:
+                    logger.debug("SMTP session idle too long, reconnecting")
+                    await self._quit(smtp)
+                    smtp = None
+            if smtp is None:
+                smtp = await self._connect()
+            try:
+                await smtp.send_message(msg, recipients=recipients)
+            except (SMTPServerDisconnected, SMTPResponseException) as e:
+                # Idle sessions get closed by the server (often with a 421);
+                # reconnect once and resend.
+                if isinstance(e, SMTPResponseException) and e.code != 421:
+                    raise
+                logger.info(f"SMTP session lost ({e}), reconnecting")
+                await self._quit(smtp)
+                smtp = None  # already closed if reconnecting fails
+                smtp = await self._connect()
+                await smtp.send_message(msg, recipients=recipients)
+        except BaseException:
+            # Don't return a session in an unknown state to the pool
+            if smtp is not None:
+                smtp.close()
+            self._sessions.put_nowait(None)
+            raise
+        self._sessions.put_nowait((smtp, time.monotonic()))
 
-        finally:
-            await smtp.quit()
+        logger.info(f"Sent email to {', '.join(recipients)}: {subject}")
@@ -1,10 +1,10 @@
 """Extract transcribable URLs from email content."""
 
 import re
-from typing import List
+from typing import List, Optional, Set
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 # Patterns for transcribable URLs
 TRANSCRIBABLE_PATTERNS = [
@@ -15,8 +15,12 @@ TRANSCRIBABLE_PATTERNS = [
     r"podcastaddict\.com/.+/episode/",
 ]
 
+# Single alternation so each URL is matched in one pass
+TRANSCRIBABLE_URL_PATTERN = re.compile("|".join(TRANSCRIBABLE_PATTERNS), re.IGNORECASE)
+
 # File extensions for direct audio URLs
 AUDIO_EXTENSIONS = {".mp3", ".m4a", ".wav", ".flac", ".ogg", ".aac"}
+AUDIO_EXTENSION_SUFFIXES = tuple(AUDIO_EXTENSIONS)
 
 # URL regex pattern
 URL_PATTERN = re.compile(
@@ -24,6 +28,9 @@ URL_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Sentence punctuation that URL_PATTERN picks up at the end of a URL
+TRAILING_PUNCTUATION = ".,;:!?)"
+
 
 def is_transcribable_url(url: str) -> bool:
     """
@@ -36,59 +43,66 @@ def is_transcribable_url(url: str) -> bool:
         True if the URL is a supported transcribable source
     """
     # Check known patterns
-    for pattern in TRANSCRIBABLE_PATTERNS:
-        if re.search(pattern, url, re.IGNORECASE):
-            return True
+    if TRANSCRIBABLE_URL_PATTERN.search(url):
+        return True
 
     # Check for direct audio file URLs
-    parsed = urlparse(url)
-    path_lower = parsed.path.lower()
-    for ext in AUDIO_EXTENSIONS:
-        if path_lower.endswith(ext):
-            return True
-
-    return False
+    return urlparse(url).path.lower().endswith(AUDIO_EXTENSION_SUFFIXES)
 
 
-def extract_urls(body: str, is_html: bool = False) -> List[str]:
+def extract_urls(
+    body: str, is_html: bool = False, seen: Optional[Set[str]] = None
+) -> List[str]:
     """
     Extract transcribable URLs from email body.
 
     Args:
         body: Email body content
         is_html: Whether the body is HTML content
+        seen: URLs already extracted (e.g. from the text part); these are
+            skipped without being re-checked and are not returned
 
     Returns:
-        List of unique transcribable URLs found in the body
+        Unique transcribable URLs, in the order they were found
     """
     if not body:
         return []
 
-    urls = set()
+    known = seen if seen is not None else set()
+    # Insertion-ordered, so duplicates are dropped as they are found and
+    # URLs come back in a stable, discovery order
+    urls: dict[str, None] = {}
 
     if is_html:
         # Parse HTML and extract URLs from href attributes and text
         soup = BeautifulSoup(body, "html.parser")
 
-        # Get URLs from anchor tags
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if is_transcribable_url(href):
-                urls.add(href)
+        # Walk the tree once, collecting anchor hrefs and the same text
+        # nodes that soup.get_text() would join.
+        text_types = soup.interesting_string_types
+        text_parts = []
+        for node in soup.descendants:
+            if type(node) in text_types:
+                text_parts.append(node)
+            elif isinstance(node, Tag) and node.name == "a":
+                href = node.get("href")
+                if href is None or href in known or href in urls:
+                    continue
+                if is_transcribable_url(href):
+                    urls[href] = None
 
         # Also search text content for URLs
-        text = soup.get_text()
-        for match in URL_PATTERN.findall(text):
-            # Clean trailing punctuation
-            clean_url = match.rstrip(".,;:!?)")
-            if is_transcribable_url(clean_url):
-                urls.add(clean_url)
+        text = "".join(text_parts)
     else:
         # Plain text - use regex to find URLs
-        for match in URL_PATTERN.findall(body):
-            # Clean trailing punctuation
-            clean_url = match.rstrip(".,;:!?)")
-            if is_transcribable_url(clean_url):
-                urls.add(clean_url)
+        text = body
+
+    for match in URL_PATTERN.finditer(text):
+        # Clean trailing punctuation
+        clean_url = match.group().rstrip(TRAILING_PUNCTUATION)
+        if clean_url in known or clean_url in urls:
+            continue
+        if is_transcribable_url(clean_url):
+            urls[clean_url] = None
 
     return list(urls)
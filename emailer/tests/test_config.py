@@ -87,3 +87,25 @@ def test_default_tag_config(monkeypatch):
     from emailer.config import Settings
     settings = Settings()
     assert settings.default_tag == "inbox"
+
+
+def test_get_settings_is_cached(monkeypatch):
+    """Test that get_settings parses the environment only once."""
+    monkeypatch.setenv("IMAP_HOST", "imap.test.com")
+    monkeypatch.setenv("IMAP_USER", "test")
+    monkeypatch.setenv("IMAP_PASSWORD", "test")
+    monkeypatch.setenv("SMTP_HOST", "smtp.test.com")
+    monkeypatch.setenv("SMTP_USER", "test")
+    monkeypatch.setenv("SMTP_PASSWORD", "test")
+    monkeypatch.setenv("RESULT_EMAIL_ADDRESS", "results@test.com")
+    monkeypatch.setenv("FROM_EMAIL_ADDRESS", "scribe@test.com")
+
+    from emailer.config import get_settings
+    get_settings.cache_clear()
+    try:
+        first = get_settings()
+        monkeypatch.setenv("IMAP_HOST", "other.test.com")
+        assert get_settings() is first
+        assert get_settings().imap_host == "imap.test.com"
+    finally:
+        get_settings.cache_clear()
@@ -2,7 +2,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
-from emailer.episode_source_processor import EpisodeSourceProcessor
+from emailer.episode_source_processor import EpisodeSourceProcessor, _dedupe_urls
 from emailer.imap_client import EmailMessage
 from emailer.job_processor import JobResult
 
@@ -255,3 +255,22 @@ class TestEpisodeSourceProcessor:
         # The successful URL should be whichever one completed
         assert result.title == "Second URL"
         assert processor.frontend.submit_url.call_count == 2
+
+
+class TestDedupeUrls:
+    """Tests for canonical URL deduplication."""
+
+    def test_ignores_tracking_params_and_fragment(self):
+        urls = [
+            "https://youtube.com/watch?v=abc&utm_source=newsletter",
+            "https://YouTube.com/watch?v=abc#t=10",
+            "https://youtube.com/watch?v=abc&fbclid=xyz",
+        ]
+        assert _dedupe_urls(urls) == ["https://youtube.com/watch?v=abc&utm_source=newsletter"]
+
+    def test_keeps_distinct_episodes(self):
+        urls = [
+            "https://podcasts.apple.com/us/podcast/show?i=1000111111",
+            "https://podcasts.apple.com/us/podcast/show?i=1000222222",
+        ]
+        assert _dedupe_urls(urls) == urls
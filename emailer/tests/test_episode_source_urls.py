@@ -1,134 +1,268 @@
 """Tests for episode source URL extraction."""
-from unittest.mock import patch, MagicMock
+import time
+from unittest.mock import patch, AsyncMock, MagicMock
 
 import httpx
 import pytest
-from emailer.episode_source_urls import extract_episode_source_urls
+from emailer import episode_source_urls
+from emailer.episode_source_urls import extract_episode_source_urls, _resolve_redirect
 
 
 class TestExtractEpisodeSourceUrls:
     """Tests for extracting Apple Podcasts and YouTube URLs only."""
 
-    def test_apple_podcasts_episode_url(self):
+    @pytest.mark.asyncio
+    async def test_apple_podcasts_episode_url(self):
         text = "Check out https://podcasts.apple.com/us/podcast/ep1?i=100012345623?i=1000123456 today!"
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert urls == ["https://podcasts.apple.com/us/podcast/ep1?i=100012345623?i=1000123456"]
 
-    def test_ignores_apple_podcasts_show_url(self):
+    @pytest.mark.asyncio
+    async def test_ignores_apple_podcasts_show_url(self):
         text = "Subscribe at https://podcasts.apple.com/us/podcast/my-show/id1234567"
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert urls == []
 
-    def test_youtube_watch_url(self):
+    @pytest.mark.asyncio
+    async def test_youtube_watch_url(self):
         text = "Watch https://youtube.com/watch?v=abc123"
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert urls == ["https://youtube.com/watch?v=abc123"]
 
-    def test_youtube_short_url(self):
+    @pytest.mark.asyncio
+    async def test_youtube_short_url(self):
         text = "See https://youtu.be/abc123"
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert urls == ["https://youtu.be/abc123"]
 
-    def test_youtube_live_url(self):
+    @pytest.mark.asyncio
+    async def test_youtube_live_url(self):
         text = "Live at https://youtube.com/live/abc123"
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert urls == ["https://youtube.com/live/abc123"]
 
-    def test_ignores_direct_audio_urls(self):
+    @pytest.mark.asyncio
+    async def test_ignores_direct_audio_urls(self):
         text = "Download https://example.com/episode.mp3"
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert urls == []
 
-    def test_ignores_podcast_addict_urls(self):
+    @pytest.mark.asyncio
+    async def test_ignores_podcast_addict_urls(self):
         text = "Listen at https://podcastaddict.com/show/episode/12345"
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert urls == []
 
-    def test_ignores_non_transcribable_urls(self):
+    @pytest.mark.asyncio
+    async def test_ignores_non_transcribable_urls(self):
         text = "Visit https://example.com and https://google.com"
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert urls == []
 
-    def test_multiple_urls_returns_all(self):
+    @pytest.mark.asyncio
+    async def test_multiple_urls_returns_all(self):
         text = (
             "Apple: https://podcasts.apple.com/us/podcast/test?i=1000123456 "
             "YouTube: https://youtube.com/watch?v=abc"
         )
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert len(urls) == 2
 
-    def test_html_extracts_from_hrefs(self):
+    @pytest.mark.asyncio
+    async def test_mixed_urls_with_trailing_punctuation(self):
+        text = (
+            "Links: https://example.com/page, https://youtu.be/abc123. "
+            "(https://podcasts.apple.com/us/podcast/show/id99) and "
+            "https://podcasts.apple.com/us/podcast/ep?i=1000123456!"
+        )
+        urls = await extract_episode_source_urls(text=text)
+        assert sorted(urls) == [
+            "https://podcasts.apple.com/us/podcast/ep?i=1000123456",
+            "https://youtu.be/abc123",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_html_extracts_from_hrefs(self):
         html = '<a href="https://podcasts.apple.com/us/podcast/ep1?i=1000123456?i=1000123456">Listen</a>'
-        urls = extract_episode_source_urls(html, is_html=True)
+        urls = await extract_episode_source_urls(html=html)
         assert urls == ["https://podcasts.apple.com/us/podcast/ep1?i=1000123456?i=1000123456"]
 
-    def test_html_ignores_non_matching_hrefs(self):
+    @pytest.mark.asyncio
+    async def test_html_extracts_from_text_content(self):
+        html = "<p>Watch https://youtube.com/watch?v=text1 now</p><script>var u = 'https://youtu.be/script';</script>"
+        urls = await extract_episode_source_urls(html=html)
+        assert urls == ["https://youtube.com/watch?v=text1"]
+
+    @pytest.mark.asyncio
+    async def test_html_ignores_non_matching_hrefs(self):
         html = '<a href="https://example.com/page">Link</a>'
-        urls = extract_episode_source_urls(html, is_html=True)
+        urls = await extract_episode_source_urls(html=html)
         assert urls == []
 
-    def test_deduplicates_urls(self):
+    @pytest.mark.asyncio
+    async def test_html_href_host_match_is_case_insensitive(self):
+        html = '<a href="https://Podcasts.Apple.com/us/podcast/show/id1?i=1000123">Listen</a>'
+        urls = await extract_episode_source_urls(html=html)
+        assert urls == ["https://Podcasts.Apple.com/us/podcast/show/id1?i=1000123"]
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_urls(self):
         text = (
             "https://podcasts.apple.com/test?i=1000123456 "
             "https://podcasts.apple.com/test?i=1000123456"
         )
-        urls = extract_episode_source_urls(text, is_html=False)
+        urls = await extract_episode_source_urls(text=text)
         assert len(urls) == 1
 
-    def test_empty_input(self):
-        assert extract_episode_source_urls("", is_html=False) == []
-        assert extract_episode_source_urls("", is_html=True) == []
+    @pytest.mark.asyncio
+    async def test_returns_urls_in_document_order(self):
+        html = (
+            '<a href="https://youtu.be/second">Watch</a>'
+            '<a href="https://youtube.com/watch?v=first">Watch</a>'
+            '<a href="https://youtu.be/second">Watch again</a>'
+        )
+        urls = await extract_episode_source_urls(html=html)
+        assert urls == ["https://youtu.be/second", "https://youtube.com/watch?v=first"]
+
+    @pytest.mark.asyncio
+    async def test_text_and_html_parts_in_one_call(self):
+        text = "Listen: https://youtu.be/abc123"
+        html = '<a href="https://podcasts.apple.com/us/podcast/show/id123?i=1000456">Listen</a>'
+        urls = await extract_episode_source_urls(text=text, html=html)
+        assert sorted(urls) == [
+            "https://podcasts.apple.com/us/podcast/show/id123?i=1000456",
+            "https://youtu.be/abc123",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_uppercase_host_passes_prefilter(self):
+        text = "Watch HTTPS://WWW.YOUTUBE.COM/watch?v=abc123"
+        urls = await extract_episode_source_urls(text=text)
+        assert urls == ["HTTPS://WWW.YOUTUBE.COM/watch?v=abc123"]
+
+    @pytest.mark.asyncio
+    async def test_text_without_matching_host_skips_regex(self):
+        text = "Read more at https://example.substack.com/p/post?utm_source=email"
+        with patch("emailer.episode_source_urls.TEXT_URL_PATTERN") as mock_pattern:
+            urls = await extract_episode_source_urls(text=text)
+        assert urls == []
+        mock_pattern.finditer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_long_unbroken_url_runs_scan_in_linear_time(self):
+        # Back-to-back URLs with no separators used to be rescanned from
+        # every "http" in the run (about 10s for this input)
+        text = ("http://" + "a" * 50) * 2000 + " youtube.com/"
+        start = time.perf_counter()
+        urls = await extract_episode_source_urls(text=text)
+        assert urls == []
+        assert time.perf_counter() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_html_parsed_off_event_loop(self):
+        import threading
+
+        loop_thread = threading.get_ident()
+        parse_threads = []
+        real_scan = episode_source_urls._scan_html
+
+        def recording_scan(*args):
+            parse_threads.append(threading.get_ident())
+            return real_scan(*args)
+
+        html = '<a href="https://youtu.be/abc123">Watch</a>'
+        with patch("emailer.episode_source_urls._scan_html", side_effect=recording_scan):
+            urls = await extract_episode_source_urls(html=html)
+        assert urls == ["https://youtu.be/abc123"]
+        assert len(parse_threads) == 1
+        assert parse_threads[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self):
+        assert await extract_episode_source_urls(text="") == []
+        assert await extract_episode_source_urls(html="") == []
+
+    @pytest.mark.asyncio
+    @patch("emailer.episode_source_urls.MAX_PARSED_HTML_CHARS", 100)
+    async def test_large_html_scanned_without_parsing(self):
+        html = (
+            '<img src="https://cdn.example.com/banner.png">' * 5
+            + '<a href="https://podcasts.apple.com/us/podcast/show/id1?uo=4&amp;i=1000123">Listen</a>'
+        )
+        with patch("emailer.episode_source_urls.BeautifulSoup") as mock_soup:
+            urls = await extract_episode_source_urls(html=html)
+        assert urls == ["https://podcasts.apple.com/us/podcast/show/id1?uo=4&i=1000123"]
+        mock_soup.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("emailer.episode_source_urls._resolve_redirect")
+    @patch("emailer.episode_source_urls.MAX_PARSED_HTML_CHARS", 100)
+    async def test_large_html_parsed_when_regex_finds_nothing(self, mock_resolve):
+        mock_resolve.return_value = "https://youtube.com/watch?v=abc"
+        html = (
+            '<img src="https://cdn.example.com/banner.png">' * 5
+            + '<a href="https://substack.com/redirect/1">YouTube</a>'
+        )
+        urls = await extract_episode_source_urls(html=html)
+        assert urls == ["https://youtube.com/watch?v=abc"]
 
 
 class TestRedirectResolution:
     """Tests for resolving redirect URLs based on link text hints."""
 
+    @pytest.mark.asyncio
     @patch("emailer.episode_source_urls._resolve_redirect")
-    def test_resolves_redirect_when_link_text_says_apple_podcasts(self, mock_resolve):
+    async def test_resolves_redirect_when_link_text_says_apple_podcasts(self, mock_resolve):
         mock_resolve.return_value = "https://podcasts.apple.com/us/podcast/ep1?i=1000123456"
         html = '<a href="https://substack.com/redirect/abc123">Apple Podcasts</a>'
-        urls = extract_episode_source_urls(html, is_html=True)
+        urls = await extract_episode_source_urls(html=html)
         assert urls == ["https://podcasts.apple.com/us/podcast/ep1?i=1000123456"]
         mock_resolve.assert_called_once_with("https://substack.com/redirect/abc123")
 
+    @pytest.mark.asyncio
     @patch("emailer.episode_source_urls._resolve_redirect")
-    def test_resolves_redirect_when_link_text_says_youtube(self, mock_resolve):
+    async def test_resolves_redirect_when_link_text_says_youtube(self, mock_resolve):
         mock_resolve.return_value = "https://youtube.com/watch?v=xyz"
         html = '<a href="https://substack.com/redirect/def456">YouTube</a>'
-        urls = extract_episode_source_urls(html, is_html=True)
+        urls = await extract_episode_source_urls(html=html)
         assert urls == ["https://youtube.com/watch?v=xyz"]
         mock_resolve.assert_called_once_with("https://substack.com/redirect/def456")
 
+    @pytest.mark.asyncio
     @patch("emailer.episode_source_urls._resolve_redirect")
-    def test_skips_redirect_when_link_text_does_not_match(self, mock_resolve):
+    async def test_skips_redirect_when_link_text_does_not_match(self, mock_resolve):
         html = '<a href="https://substack.com/redirect/abc">Read more</a>'
-        urls = extract_episode_source_urls(html, is_html=True)
+        urls = await extract_episode_source_urls(html=html)
         assert urls == []
         mock_resolve.assert_not_called()
 
+    @pytest.mark.asyncio
     @patch("emailer.episode_source_urls._resolve_redirect")
-    def test_skips_when_resolved_url_is_not_episode_source(self, mock_resolve):
+    async def test_skips_when_resolved_url_is_not_episode_source(self, mock_resolve):
         mock_resolve.return_value = "https://example.com/some-page"
         html = '<a href="https://substack.com/redirect/abc">Apple Podcasts</a>'
-        urls = extract_episode_source_urls(html, is_html=True)
+        urls = await extract_episode_source_urls(html=html)
         assert urls == []
 
+    @pytest.mark.asyncio
     @patch("emailer.episode_source_urls._resolve_redirect")
-    def test_skips_when_redirect_fails(self, mock_resolve):
+    async def test_skips_when_redirect_fails(self, mock_resolve):
         mock_resolve.return_value = None
         html = '<a href="https://substack.com/redirect/abc">YouTube</a>'
-        urls = extract_episode_source_urls(html, is_html=True)
+        urls = await extract_episode_source_urls(html=html)
         assert urls == []
 
+    @pytest.mark.asyncio
     @patch("emailer.episode_source_urls._resolve_redirect")
-    def test_no_redirect_needed_when_href_already_matches(self, mock_resolve):
+    async def test_no_redirect_needed_when_href_already_matches(self, mock_resolve):
         html = '<a href="https://podcasts.apple.com/us/podcast/ep1?i=1000123456">Apple Podcasts</a>'
-        urls = extract_episode_source_urls(html, is_html=True)
+        urls = await extract_episode_source_urls(html=html)
         assert urls == ["https://podcasts.apple.com/us/podcast/ep1?i=1000123456"]
         mock_resolve.assert_not_called()
 
+    @pytest.mark.asyncio
     @patch("emailer.episode_source_urls._resolve_redirect")
-    def test_resolves_multiple_redirect_links(self, mock_resolve):
+    async def test_resolves_multiple_redirect_links(self, mock_resolve):
         mock_resolve.side_effect = [
             "https://podcasts.apple.com/us/podcast/ep1?i=1000123456",
             "https://youtube.com/watch?v=abc",
@@ -137,7 +271,85 @@ class TestRedirectResolution:
             '<a href="https://substack.com/redirect/1">Apple Podcasts</a>'
             '<a href="https://substack.com/redirect/2">YouTube</a>'
         )
-        urls = extract_episode_source_urls(html, is_html=True)
+        urls = await extract_episode_source_urls(html=html)
         assert len(urls) == 2
         assert "https://podcasts.apple.com/us/podcast/ep1?i=1000123456" in urls
         assert "https://youtube.com/watch?v=abc" in urls
+
+    @pytest.mark.asyncio
+    @patch("emailer.episode_source_urls._resolve_redirect")
+    async def test_resolves_repeated_redirect_link_once(self, mock_resolve):
+        mock_resolve.return_value = "https://youtube.com/watch?v=abc"
+        html = (
+            '<a href="https://substack.com/redirect/1">Watch on YouTube</a>'
+            '<a href="https://substack.com/redirect/1">YouTube</a>'
+        )
+        urls = await extract_episode_source_urls(html=html)
+        assert urls == ["https://youtube.com/watch?v=abc"]
+        mock_resolve.assert_called_once_with("https://substack.com/redirect/1")
+
+    @pytest.mark.asyncio
+    @patch("emailer.episode_source_urls._resolve_redirect")
+    async def test_skips_redirect_for_non_http_and_direct_hosts(self, mock_resolve):
+        html = (
+            '<a href="mailto:host@example.com">YouTube</a>'
+            '<a href="#listen">Apple Podcasts</a>'
+            '<a href="https://podcasts.apple.com/us/podcast/show/id123">Apple Podcasts</a>'
+            '<a href="https://www.youtube.com/@channel">YouTube</a>'
+        )
+        urls = await extract_episode_source_urls(html=html)
+        assert urls == []
+        mock_resolve.assert_not_called()
+
+
+class TestResolveRedirectCache:
+    """Tests for caching of resolved redirect URLs."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        episode_source_urls._redirect_cache.clear()
+        yield
+        episode_source_urls._redirect_cache.clear()
+
+    @pytest.mark.asyncio
+    @patch("emailer.episode_source_urls._get_redirect_client")
+    async def test_repeated_url_is_resolved_once(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.head = AsyncMock(
+            return_value=MagicMock(url="https://youtube.com/watch?v=abc")
+        )
+        mock_get_client.return_value = mock_client
+
+        first = await _resolve_redirect("https://substack.com/redirect/1")
+        second = await _resolve_redirect("https://substack.com/redirect/1")
+
+        assert first == second == "https://youtube.com/watch?v=abc"
+        mock_client.head.assert_called_once_with("https://substack.com/redirect/1")
+
+    @pytest.mark.asyncio
+    @patch("emailer.episode_source_urls._get_redirect_client")
+    async def test_failures_are_not_cached(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.head = AsyncMock(
+            side_effect=[httpx.ConnectError("boom"), MagicMock(url="https://youtu.be/abc")]
+        )
+        mock_get_client.return_value = mock_client
+
+        assert await _resolve_redirect("https://substack.com/redirect/2") is None
+        assert await _resolve_redirect("https://substack.com/redirect/2") == "https://youtu.be/abc"
+
+
+class TestRedirectClient:
+    """Tests for the shared redirect resolution client."""
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_and_resets_shared_client(self):
+        client = episode_source_urls._get_redirect_client()
+        assert episode_source_urls._get_redirect_client() is client
+
+        await episode_source_urls.aclose_redirect_client()
+
+        assert client.is_closed
+        assert episode_source_urls._redirect_client is None
+        # Closing again is a no-op
+        await episode_source_urls.aclose_redirect_client()
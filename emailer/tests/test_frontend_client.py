@@ -3,7 +3,11 @@
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
-from emailer.frontend_client import FrontendClient, TranscriptionResult
+from emailer.frontend_client import (
+    TAG_CACHE_TTL_SECONDS,
+    FrontendClient,
+    TranscriptionResult,
+)
 
 
 class TestFrontendClient:
@@ -14,7 +18,7 @@ class TestFrontendClient:
         """Test that submit_url returns the transcription ID."""
         with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             mock_instance.post = AsyncMock(
                 return_value=MagicMock(
                     status_code=202,
@@ -32,7 +36,7 @@ class TestFrontendClient:
         """Test that submit_url raises on API error."""
         with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             mock_instance.post = AsyncMock(
                 return_value=MagicMock(
                     status_code=400,
@@ -56,7 +60,7 @@ class TestFrontendClient:
         """Test that get_transcription returns TranscriptionResult."""
         with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             mock_instance.get = AsyncMock(
                 return_value=MagicMock(
                     status_code=200,
@@ -81,12 +85,33 @@ class TestFrontendClient:
             assert result.full_text == "Hello world"
             assert result.duration_seconds == 120
 
+    @pytest.mark.asyncio
+    async def test_get_transcription_status_returns_status(self):
+        """Test that get_transcription_status reads the status endpoint."""
+        with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value = mock_instance
+            mock_instance.get = AsyncMock(
+                return_value=MagicMock(
+                    status_code=200,
+                    json=lambda: {"id": "youtube_abc123", "status": "transcribing", "progress": 40},
+                )
+            )
+
+            client = FrontendClient(base_url="http://localhost:8000")
+            status = await client.get_transcription_status("youtube_abc123")
+
+            assert status == "transcribing"
+            mock_instance.get.assert_awaited_once_with(
+                "http://localhost:8000/api/transcriptions/youtube_abc123/status"
+            )
+
     @pytest.mark.asyncio
     async def test_generate_summary_returns_text(self):
         """Test that generate_summary returns summary text."""
         with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             # First call creates summary
             mock_instance.post = AsyncMock(
                 return_value=MagicMock(
@@ -108,7 +133,7 @@ class TestFrontendClient:
         """Test that get_tags returns a set of tag names."""
         with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             mock_instance.get = AsyncMock(
                 return_value=MagicMock(
                     status_code=200,
@@ -129,7 +154,7 @@ class TestFrontendClient:
         """Test submitting URL with a tag."""
         with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             mock_instance.post = AsyncMock(
                 return_value=MagicMock(
                     status_code=202,
@@ -151,7 +176,7 @@ class TestFrontendClient:
         """Test that get_tag_config returns tag configuration."""
         with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             mock_instance.get = AsyncMock(
                 return_value=MagicMock(
                     status_code=200,
@@ -178,7 +203,7 @@ class TestFrontendClient:
         """Test that get_tag_config returns None for unknown tag."""
         with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             mock_response = MagicMock(status_code=404)
             mock_response.raise_for_status = MagicMock(
                 side_effect=httpx.HTTPStatusError(
@@ -194,12 +219,53 @@ class TestFrontendClient:
 
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_tags_and_tag_config_are_cached(self):
+        """Test that repeated tag lookups within the TTL skip the network."""
+        with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value = mock_instance
+            mock_instance.get = AsyncMock(
+                return_value=MagicMock(
+                    status_code=200,
+                    json=lambda: {"tags": {"podcast": {}}, "name": "podcast"},
+                )
+            )
+
+            client = FrontendClient(base_url="http://localhost:8000")
+            tags = await client.get_tags()
+            tags.add("mutated")
+            assert await client.get_tags() == {"podcast"}
+            await client.get_tag_config("podcast")
+            await client.get_tag_config("podcast")
+
+            assert mock_instance.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_tag_config_refetches_after_ttl(self):
+        """Test that cached tag configs expire after TAG_CACHE_TTL_SECONDS."""
+        with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client, \
+             patch("emailer.frontend_client.time.monotonic") as mock_monotonic:
+            mock_instance = AsyncMock()
+            mock_client.return_value = mock_instance
+            mock_instance.get = AsyncMock(
+                return_value=MagicMock(status_code=200, json=lambda: {"name": "kindle"})
+            )
+            mock_monotonic.return_value = 1000.0
+
+            client = FrontendClient(base_url="http://localhost:8000")
+            await client.get_tag_config("kindle")
+            mock_monotonic.return_value = 1000.0 + TAG_CACHE_TTL_SECONDS + 1
+            await client.get_tag_config("kindle")
+
+            assert mock_instance.get.await_count == 2
+
     @pytest.mark.asyncio
     async def test_generate_summary_with_suffix(self):
         """Test that generate_summary passes system_prompt_suffix."""
         with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_client.return_value = mock_instance
             mock_instance.post = AsyncMock(
                 return_value=MagicMock(
                     status_code=200,
@@ -218,6 +284,136 @@ class TestFrontendClient:
             call_args = mock_instance.post.call_args
             assert call_args[1]["json"]["system_prompt_suffix"] == "Format as HTML"
 
+    @pytest.mark.asyncio
+    async def test_reuses_http_client_across_calls(self):
+        """Test that one HTTP client is shared by all requests until closed."""
+        with patch("emailer.frontend_client.httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value = mock_instance
+            mock_instance.get = AsyncMock(
+                return_value=MagicMock(
+                    status_code=200,
+                    json=lambda: {"tags": {"podcast": {}}},
+                )
+            )
+
+            client = FrontendClient(base_url="http://localhost:8000")
+            await client.get_tags()
+            await client.get_tag_config("podcast")
+
+            mock_client.assert_called_once()
+            assert mock_instance.get.call_count == 2
+
+            await client.aclose()
+            mock_instance.aclose.assert_called_once()
+
+
+class TestWaitForCompletion:
+    """Tests for wait_for_completion polling."""
+
+    @pytest.mark.asyncio
+    async def test_poll_interval_backs_off_exponentially(self):
+        """Test that the delay between polls grows and is capped."""
+        client = FrontendClient(base_url="http://localhost:8000")
+        client._events_supported = False
+        client.get_transcription_status = AsyncMock(
+            side_effect=["pending"] * 5 + ["completed"]
+        )
+        client.get_transcription = AsyncMock(
+            return_value=TranscriptionResult(transcription_id="t1", status="completed")
+        )
+
+        with patch("emailer.frontend_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await client.wait_for_completion(
+                "t1", poll_interval=2.0, max_poll_interval=5.0, backoff_factor=2.0
+            )
+
+        assert result.status == "completed"
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == [2.0, 4.0, 5.0, 5.0, 5.0]
+        client.get_transcription.assert_awaited_once_with("t1")
+
+    @pytest.mark.asyncio
+    async def test_raises_timeout_when_max_wait_exceeded(self):
+        """Test that TimeoutError is raised once max_wait elapses."""
+        client = FrontendClient(base_url="http://localhost:8000")
+        client._events_supported = False
+        client.get_transcription_status = AsyncMock(return_value="pending")
+
+        with pytest.raises(TimeoutError):
+            await client.wait_for_completion("t1", poll_interval=0.01, max_wait=0.05)
+
+    @pytest.mark.asyncio
+    async def test_uses_event_stream_when_available(self):
+        """Test that completion is read from the events stream without polling."""
+        def handler(request):
+            if request.url.path.endswith("/events"):
+                body = (
+                    'data: {"id": "t1", "status": "transcribing", "progress": 50}\n\n'
+                    ": keep-alive\n\n"
+                    'data: {"id": "t1", "status": "completed", "progress": 100}\n\n'
+                )
+                return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+            return httpx.Response(200, json={"id": "t1", "status": "completed", "source": {"title": "Done"}})
+
+        client = FrontendClient(base_url="http://localhost:8000")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.wait_for_completion("t1")
+
+        assert result.status == "completed"
+        assert result.title == "Done"
+        assert client._events_supported is True
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling_without_events_endpoint(self):
+        """Test that a 404 from the events endpoint switches to polling."""
+        requested_paths = []
+
+        def handler(request):
+            requested_paths.append(request.url.path)
+            if request.url.path.endswith("/events"):
+                return httpx.Response(404, json={"detail": "Not Found"})
+            return httpx.Response(200, json={"id": "t1", "status": "completed"})
+
+        client = FrontendClient(base_url="http://localhost:8000")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.wait_for_completion("t1")
+        await client.wait_for_completion("t1")
+
+        assert result.status == "completed"
+        assert client._events_supported is False
+        assert requested_paths.count("/api/transcriptions/t1/events") == 1
+        assert "/api/transcriptions/t1/status" in requested_paths
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unknown_transcription_keeps_events_enabled(self):
+        """Test that a 404 for an unknown id fails the wait without disabling events."""
+        def handler(request):
+            if request.url.path == "/api/transcriptions/gone/events":
+                return httpx.Response(404, json={"detail": "Transcription not found"})
+            if request.url.path.endswith("/events"):
+                return httpx.Response(
+                    200,
+                    text='data: {"id": "t1", "status": "completed"}\n\n',
+                    headers={"content-type": "text/event-stream"},
+                )
+            return httpx.Response(200, json={"id": "t1", "status": "completed"})
+
+        client = FrontendClient(base_url="http://localhost:8000")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.wait_for_completion("gone")
+        result = await client.wait_for_completion("t1")
+
+        assert client._events_supported is True
+        assert result.status == "completed"
+        await client.aclose()
+
 
 class TestCreateEpisodeSource:
     """Tests for create_episode_source method."""
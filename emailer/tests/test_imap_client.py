@@ -1,8 +1,13 @@
 """Tests for IMAP client."""
 
+import imaplib
+import socket
+import threading
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
-from emailer.imap_client import ImapClient, EmailMessage
+from emailer.imap_client import ImapClient, EmailMessage, _decode_subject
 
 
 class TestEmailMessage:
@@ -21,6 +26,16 @@ class TestEmailMessage:
         assert msg.subject == "Test Subject"
 
 
+class TestDecodeSubject:
+    """Tests for subject header decoding."""
+
+    def test_plain_subject_returned_unchanged(self):
+        assert _decode_subject("Weekly digest") == "Weekly digest"
+
+    def test_encoded_words_are_decoded(self):
+        assert _decode_subject("Re: =?utf-8?q?caf=C3=A9?= news") == "Re: café news"
+
+
 class TestImapClient:
     """Tests for ImapClient."""
 
@@ -29,6 +44,7 @@ class TestImapClient:
         """Test that connect establishes IMAP connection."""
         with patch("emailer.imap_client.imaplib") as mock_imaplib:
             mock_instance = MagicMock()
+            mock_instance.capability.return_value = ("OK", [b"IMAP4rev1"])
             mock_imaplib.IMAP4_SSL.return_value = mock_instance
 
             client = ImapClient(
@@ -78,6 +94,46 @@ class TestImapClient:
 
         mock_client.store.assert_called_with("123", "+FLAGS", "\\Seen")
 
+    @pytest.mark.asyncio
+    async def test_select_folder_skips_reselect_of_current_folder(self):
+        """Test that an already-selected folder is synced with NOOP instead of SELECT."""
+        client = ImapClient(
+            host="imap.test.com",
+            port=993,
+            user="test@test.com",
+            password="testpass",
+            use_ssl=True,
+        )
+        mock_client = MagicMock()
+        mock_client.select.return_value = ("OK", [b"3"])
+        mock_client.noop.return_value = ("OK", [])
+        client._client = mock_client
+
+        await client.select_folder("INBOX")
+        await client.select_folder("INBOX")
+        await client.select_folder("Archive")
+
+        assert [c.args[0] for c in mock_client.select.call_args_list] == ["INBOX", "Archive"]
+        mock_client.noop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mark_seen_many_uses_single_store(self):
+        """Test that mark_seen_many flags all messages in one STORE."""
+        client = ImapClient(
+            host="imap.test.com",
+            port=993,
+            user="test@test.com",
+            password="testpass",
+            use_ssl=True,
+        )
+        mock_client = MagicMock()
+        client._client = mock_client
+
+        await client.mark_seen_many(["3", "5", "8"])
+        await client.mark_seen_many([])
+
+        mock_client.store.assert_called_once_with("3,5,8", "+FLAGS", "\\Seen")
+
     @pytest.mark.asyncio
     async def test_move_to_folder(self):
         """Test that move_to_folder moves email to destination."""
@@ -91,12 +147,124 @@ class TestImapClient:
         mock_client = MagicMock()
         mock_client.copy.return_value = ("OK", [])
         client._client = mock_client
+        client._selected_folder = "ToScribe"
 
-        await client.move_to_folder("123", "ScribeDone")
+        await client.move_to_folder("123", "ScribeDone", "ToScribe")
 
         mock_client.copy.assert_called_with("123", "ScribeDone")
-        mock_client.store.assert_called_with("123", "+FLAGS", "\\Deleted")
+        mock_client.store.assert_called_with("123", "+FLAGS.SILENT", "\\Deleted")
+        mock_client.expunge.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_move_many_expunges_once_across_folders(self):
+        """Test that moves to several folders share one STORE and EXPUNGE."""
+        client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+        mock_client = MagicMock()
+        mock_client.copy.return_value = ("OK", [])
+        client._client = mock_client
+        client._has_move = True
+        client._selected_folder = "ToScribe"
+
+        await client.move_many("ToScribe", {"ScribeDone": ["1", "3"], "ScribeError": ["2"], "Empty": []})
+
+        assert [c.args for c in mock_client.copy.call_args_list] == [
+            ("1,3", "ScribeDone"),
+            ("2", "ScribeError"),
+        ]
+        mock_client.store.assert_called_once_with("1,3,2", "+FLAGS.SILENT", "\\Deleted")
         mock_client.expunge.assert_called_once()
+        mock_client._simple_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_move_many_uses_single_move_for_one_folder(self):
+        """Test that a single target folder uses one MOVE for all messages."""
+        client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+        mock_client = MagicMock()
+        mock_client._simple_command.return_value = ("OK", [])
+        client._client = mock_client
+        client._has_move = True
+        client._selected_folder = "ToScribe"
+
+        await client.move_many("ToScribe", {"ScribeDone": ["4", "5"]})
+
+        mock_client._simple_command.assert_called_once_with("MOVE", "4,5", "ScribeDone")
+        mock_client.copy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_unseen_batches_fetch_commands(self):
+        """Test that unseen messages are fetched in batched FETCH commands."""
+        client = ImapClient(
+            host="imap.test.com",
+            port=993,
+            user="test@test.com",
+            password="testpass",
+            use_ssl=True,
+        )
+        mock_client = MagicMock()
+        mock_client.select.return_value = ("OK", [b"3"])
+        mock_client.search.return_value = ("OK", [b"1 2 3"])
+
+        def fetch(msg_set, parts):
+            data = []
+            for num in msg_set.split(","):
+                raw = f"From: a@example.com\r\nSubject: Msg {num}\r\n\r\nBody {num}".encode()
+                data.append((f"{num} (BODY[] {{{len(raw)}}}".encode(), raw))
+                data.append(b")")
+            return ("OK", data)
+
+        mock_client.fetch.side_effect = fetch
+        client._client = mock_client
+
+        with patch("emailer.imap_client.FETCH_BATCH_SIZE", 2):
+            messages = await client.fetch_unseen("INBOX")
+
+        assert [m.msg_num for m in messages] == ["1", "2", "3"]
+        assert [m.subject for m in messages] == ["Msg 1", "Msg 2", "Msg 3"]
+        assert messages[2].body_text == "Body 3"
+        assert [c.args[0] for c in mock_client.fetch.call_args_list] == ["1,2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_connect_detects_move_capability_after_login(self):
+        """Test that MOVE support is read from post-login capabilities."""
+        with patch("emailer.imap_client.imaplib") as mock_imaplib:
+            mock_instance = MagicMock()
+            mock_instance.capabilities = ("IMAP4REV1",)
+            mock_instance.capability.return_value = ("OK", [b"IMAP4rev1 IDLE MOVE"])
+            mock_imaplib.IMAP4_SSL.return_value = mock_instance
+
+            client = ImapClient(
+                host="imap.test.com",
+                port=993,
+                user="test@test.com",
+                password="testpass",
+                use_ssl=True,
+            )
+
+            await client.connect()
+
+            assert client._has_move is True
+
+    @pytest.mark.asyncio
+    async def test_move_to_folder_uses_move_when_supported(self):
+        """Test that move_to_folder issues a single MOVE when supported."""
+        client = ImapClient(
+            host="imap.test.com",
+            port=993,
+            user="test@test.com",
+            password="testpass",
+            use_ssl=True,
+        )
+        mock_client = MagicMock()
+        mock_client._simple_command.return_value = ("OK", [])
+        client._client = mock_client
+        client._has_move = True
+        client._selected_folder = "ToScribe"
+
+        await client.move_to_folder("123", "ScribeDone", "ToScribe")
+
+        mock_client._simple_command.assert_called_once_with("MOVE", "123", "ScribeDone")
+        mock_client.copy.assert_not_called()
+        mock_client.expunge.assert_not_called()
 
     def test_is_connection_error_detects_eof(self):
         """Test that is_connection_error detects EOF errors."""
@@ -136,6 +304,7 @@ class TestImapClient:
         """Test that reconnect closes and reopens connection."""
         with patch("emailer.imap_client.imaplib") as mock_imaplib:
             mock_instance = MagicMock()
+            mock_instance.capability.return_value = ("OK", [b"IMAP4rev1"])
             mock_imaplib.IMAP4_SSL.return_value = mock_instance
 
             client = ImapClient(
@@ -153,3 +322,266 @@ class TestImapClient:
             old_client.logout.assert_called_once()
             mock_imaplib.IMAP4_SSL.assert_called_once_with("imap.test.com", 993)
             mock_instance.login.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_ensure_connected_skips_noop_for_recent_session(self):
+        """Test that a recently used session is not probed."""
+        client = ImapClient(
+            host="imap.test.com",
+            port=993,
+            user="test@test.com",
+            password="testpass",
+        )
+        mock_client = MagicMock()
+        client._client = mock_client
+        client._last_activity = time.monotonic()
+
+        await client.ensure_connected()
+
+        mock_client.noop.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ensure_connected_reconnects_when_idle_session_dropped(self):
+        """Test that a failed NOOP on an idle session triggers a reconnect."""
+        with patch("emailer.imap_client.imaplib") as mock_imaplib:
+            new_instance = MagicMock()
+            new_instance.capability.return_value = ("OK", [b"IMAP4rev1"])
+            mock_imaplib.IMAP4_SSL.return_value = new_instance
+
+            client = ImapClient(
+                host="imap.test.com",
+                port=993,
+                user="test@test.com",
+                password="testpass",
+                use_ssl=True,
+            )
+            old_client = MagicMock()
+            old_client.noop.side_effect = OSError("socket error: EOF")
+            client._client = old_client
+
+            await client.ensure_connected()
+
+            old_client.noop.assert_called_once()
+            old_client.shutdown.assert_called_once()
+            assert client._client is new_instance
+            new_instance.login.assert_called_once_with("test@test.com", "testpass")
+
+    @pytest.mark.asyncio
+    async def test_move_to_folder_reselects_source_after_reconnect(self):
+        """Test that a move on a reconnected session selects the source folder first."""
+        with patch("emailer.imap_client.imaplib") as mock_imaplib:
+            new_instance = MagicMock()
+            new_instance.capability.return_value = ("OK", [b"IMAP4rev1"])
+            new_instance.select.return_value = ("OK", [b"3"])
+            new_instance.copy.return_value = ("OK", [])
+            mock_imaplib.IMAP4_SSL.return_value = new_instance
+
+            client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+            old_client = MagicMock()
+            old_client.noop.side_effect = OSError("socket error: EOF")
+            client._client = old_client
+            client._selected_folder = "ToScribe"
+
+            await client.move_to_folder("123", "ScribeDone", "ToScribe")
+
+            new_instance.select.assert_called_once_with("ToScribe")
+            calls = [c[0] for c in new_instance.method_calls]
+            assert calls.index("select") < calls.index("copy")
+            new_instance.copy.assert_called_once_with("123", "ScribeDone")
+
+    @pytest.mark.asyncio
+    async def test_move_many_reselects_source_after_reconnect(self):
+        """Test that a batched move on a reconnected session selects the source folder first."""
+        with patch("emailer.imap_client.imaplib") as mock_imaplib:
+            new_instance = MagicMock()
+            new_instance.capability.return_value = ("OK", [b"IMAP4rev1 MOVE"])
+            new_instance.select.return_value = ("OK", [b"3"])
+            new_instance._simple_command.return_value = ("OK", [])
+            mock_imaplib.IMAP4_SSL.return_value = new_instance
+
+            client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+            old_client = MagicMock()
+            old_client.noop.side_effect = OSError("socket error: EOF")
+            client._client = old_client
+            client._selected_folder = "ToScribe"
+
+            await client.move_many("ToScribe", {"ScribeDone": ["1", "2"]})
+
+            calls = [c[0] for c in new_instance.method_calls]
+            assert calls.index("select") < calls.index("_simple_command")
+            new_instance.select.assert_called_once_with("ToScribe")
+            new_instance._simple_command.assert_called_once_with("MOVE", "1,2", "ScribeDone")
+
+    @staticmethod
+    def _idle_client(responses):
+        """Build an imaplib stand-in that replays untagged IDLE responses."""
+        imap = MagicMock(spec=["_new_tag", "send", "tagged_commands", "untagged_responses",
+                               "_get_response", "_get_tagged_response", "sock"])
+        imap._new_tag.return_value = b"A7"
+        imap.tagged_commands = {}
+        imap.untagged_responses = {}
+        imap.sock = MagicMock(spec=[])
+        pending = list(responses)
+
+        def get_response():
+            if not pending:
+                return b"* OK still here"
+            typ = pending.pop(0)
+            if typ is None:
+                return None  # continuation
+            imap.untagged_responses.setdefault(typ, []).append(b"4")
+            return b"* 4 " + typ.encode()
+
+        imap._get_response.side_effect = get_response
+        imap._get_tagged_response.return_value = ("OK", [b"IDLE terminated"])
+        return imap
+
+    def test_idle_returns_true_when_server_reports_new_mail(self):
+        """Test that IDLE ends with DONE once the server sends EXISTS."""
+        client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+        client._client = self._idle_client([None, "RECENT", "EXISTS"])
+
+        with patch.object(ImapClient, "_response_ready", return_value=True):
+            assert client._idle(60) is True
+
+        sent = [call.args[0] for call in client._client.send.call_args_list]
+        assert sent == [b"A7 IDLE\r\n", b"DONE\r\n"]
+        client._client._get_tagged_response.assert_called_once_with(b"A7")
+
+    def test_idle_sees_exists_sent_in_same_segment_as_other_responses(self):
+        """Test that lines buffered behind the one just read are not missed."""
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+
+        def serve():
+            conn, _ = listener.accept()
+            with conn, conn.makefile("rb") as reader:
+                conn.sendall(b"* OK ready\r\n")
+                tag = reader.readline().split()[0]  # CAPABILITY
+                conn.sendall(b"* CAPABILITY IMAP4rev1 IDLE\r\n" + tag + b" OK done\r\n")
+                tag = reader.readline().split()[0]  # IDLE
+                conn.sendall(b"+ idling\r\n")
+                time.sleep(0.3)
+                # Both responses arrive in one recv()
+                conn.sendall(b"* 3 EXPUNGE\r\n* 4 EXISTS\r\n")
+                reader.readline()  # DONE
+                conn.sendall(tag + b" OK IDLE terminated\r\n")
+
+        server = threading.Thread(target=serve, daemon=True)
+        server.start()
+        client = ImapClient(host="127.0.0.1", port=0, user="u", password="p", use_ssl=False)
+        client._client = imaplib.IMAP4("127.0.0.1", listener.getsockname()[1])
+        try:
+            start = time.monotonic()
+            assert client._idle(5) is True
+            assert time.monotonic() - start < 2
+        finally:
+            client._client.shutdown()
+            listener.close()
+            server.join(timeout=1)
+
+    def test_idle_returns_true_for_new_mail_reported_before_idle(self):
+        """Test that EXISTS seen since the last SEARCH is not discarded."""
+        client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+        client._client = self._idle_client([None])
+        client._client.untagged_responses["EXISTS"] = [b"4"]
+
+        with patch("emailer.imap_client.select.select") as mock_select:
+            assert client._idle(60) is True
+            mock_select.assert_not_called()
+
+        client._client.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_unseen_clears_exists_covered_by_search(self):
+        """Test that EXISTS reported before SEARCH does not wake the next IDLE."""
+        client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+        mock_client = MagicMock()
+        mock_client.select.return_value = ("OK", [b"3"])
+        mock_client.search.return_value = ("OK", [b""])
+        mock_client.untagged_responses = {"EXISTS": [b"3"]}
+        client._client = mock_client
+
+        assert await client.fetch_unseen("ToScribe") == []
+
+        assert "EXISTS" not in mock_client.untagged_responses
+
+    def test_idle_returns_false_when_stopped(self):
+        """Test that stop_idle ends IDLE without waiting for the timeout."""
+        client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+        client._client = self._idle_client([None])
+        client.stop_idle()
+
+        with patch("emailer.imap_client.select.select") as mock_select:
+            assert client._idle(60) is False
+            mock_select.assert_not_called()
+
+        assert client._client.send.call_args_list[-1].args[0] == b"DONE\r\n"
+
+    @pytest.mark.asyncio
+    async def test_stop_idle_during_select_is_kept(self):
+        """Test that stop_idle() while idle() selects the folder still stops it."""
+        client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+        client._client = MagicMock()
+        stop_seen = []
+
+        async def select_folder(folder):
+            client.stop_idle()
+
+        def fake_idle(timeout):
+            stop_seen.append(client._idle_stop.is_set())
+            return False
+
+        with patch.object(client, "select_folder", side_effect=select_folder), \
+                patch.object(client, "_idle", side_effect=fake_idle):
+            assert await client.idle("ToScribe") is False
+
+        assert stop_seen == [True]
+
+    @pytest.mark.asyncio
+    async def test_idle_failure_drops_session(self):
+        """Test that a failed IDLE forces a reconnect on next use."""
+        client = ImapClient(host="imap.test.com", port=993, user="u", password="p")
+        old_client = MagicMock()
+        old_client.noop.return_value = ("OK", [])
+        client._client = old_client
+        client._selected_folder = "ToScribe"
+
+        with patch.object(client, "_idle", side_effect=OSError("socket error: EOF")):
+            with pytest.raises(OSError):
+                await client.idle("ToScribe")
+
+        old_client.shutdown.assert_called_once()
+        assert client._client is None
+        assert client._selected_folder is None
+
+    def test_parse_message_ignores_text_attachments(self):
+        """Test that attached text files are not taken as the body."""
+        raw = (
+            b"From: a@example.com\r\n"
+            b"Subject: Attachment\r\n"
+            b'Content-Type: multipart/mixed; boundary="b"\r\n'
+            b"\r\n"
+            b"--b\r\n"
+            b"Content-Type: text/plain\r\n"
+            b'Content-Disposition: attachment; filename="notes.txt"\r\n'
+            b"\r\n"
+            b"attached notes\r\n"
+            b"--b\r\n"
+            b"Content-Type: text/html\r\n"
+            b"\r\n"
+            b"<p>Body</p>\r\n"
+            b"--b--\r\n"
+        )
+        client = ImapClient(
+            host="imap.test.com",
+            port=993,
+            user="test@test.com",
+            password="testpass",
+        )
+
+        msg = client._parse_message("7", raw)
+
+        assert msg.body_text is None
+        assert msg.body_html.strip() == "<p>Body</p>"
@@ -1,7 +1,8 @@
 """Tests for job processor."""
 
+import httpx
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from emailer.job_processor import JobProcessor, JobResult
 from emailer.frontend_client import TranscriptionResult
 
@@ -121,3 +122,215 @@ async def test_process_url_requests_html_summary():
         "test-id",
         system_prompt_suffix=HTML_SUMMARY_SUFFIX,
     )
+
+
+@pytest.mark.asyncio
+async def test_process_urls_runs_concurrently_and_keeps_order():
+    """Test that process_urls overlaps URLs up to the limit and preserves order."""
+    import asyncio
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_process_url(url, tag=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return JobResult(url=url, success=True)
+
+    processor = JobProcessor(frontend_client=AsyncMock(), max_concurrent_jobs=2)
+    processor.process_url = fake_process_url
+    urls = [f"https://example.com/{i}.mp3" for i in range(5)]
+
+    results = await processor.process_urls(urls, tag="podcast")
+
+    assert [r.url for r in results] == urls
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_process_urls_limit_is_shared_across_calls():
+    """Test that concurrent process_urls calls together stay within max_concurrent_jobs."""
+    import asyncio
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_process_url(url, tag=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return JobResult(url=url, success=True)
+
+    processor = JobProcessor(frontend_client=AsyncMock(), max_concurrent_jobs=3)
+    processor.process_url = fake_process_url
+
+    await asyncio.gather(*(
+        processor.process_urls([f"https://example.com/{n}-{i}.mp3" for i in range(4)])
+        for n in range(3)
+    ))
+
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_process_urls_reports_results_as_they_finish():
+    """Test that on_result sees fast jobs before slow ones."""
+    import asyncio
+
+    delays = {"https://example.com/slow.mp3": 0.05, "https://example.com/fast.mp3": 0.0}
+
+    async def fake_process_url(url, tag=None):
+        await asyncio.sleep(delays[url])
+        return JobResult(url=url, success=True)
+
+    processor = JobProcessor(frontend_client=AsyncMock())
+    processor.process_url = fake_process_url
+    reported = []
+
+    async def on_result(result):
+        reported.append(result.url)
+
+    results = await processor.process_urls(list(delays), on_result=on_result)
+
+    assert reported == ["https://example.com/fast.mp3", "https://example.com/slow.mp3"]
+    assert [r.url for r in results] == list(delays)
+
+
+@pytest.mark.asyncio
+async def test_process_url_retries_transient_submit_errors():
+    """Test that network errors on submit are retried before giving up."""
+    mock_client = AsyncMock()
+    mock_client.submit_url = AsyncMock(
+        side_effect=[httpx.ConnectError("connection refused"), "test-123"]
+    )
+    mock_client.wait_for_completion = AsyncMock(return_value=MagicMock(
+        status="completed",
+        title="Test",
+        duration_seconds=100,
+        error=None,
+    ))
+    mock_client.get_transcript_text = AsyncMock(return_value="Transcript text")
+    mock_client.generate_summary = AsyncMock(return_value="Summary text")
+
+    processor = JobProcessor(frontend_client=mock_client)
+    with patch("emailer.job_processor.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await processor.process_url("https://example.com/audio.mp3")
+
+    assert result.success is True
+    assert mock_client.submit_url.call_count == 2
+    mock_sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_process_url_does_not_retry_submit_after_request_sent():
+    """Test that a submit that may have reached the frontend is not sent twice."""
+    mock_client = AsyncMock()
+    mock_client.submit_url = AsyncMock(side_effect=httpx.ReadTimeout("timed out"))
+
+    processor = JobProcessor(frontend_client=mock_client)
+    with patch("emailer.job_processor.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await processor.process_url("https://example.com/audio.mp3")
+
+    assert result.success is False
+    assert mock_client.submit_url.call_count == 1
+    mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_wait_retries_share_one_deadline():
+    """Test that a retried wait only gets the time left from the first attempt."""
+    from emailer.frontend_client import WAIT_MAX_SECONDS
+
+    clock = [1000.0]
+    calls = []
+    mock_client = _completed_frontend()
+    completed = mock_client.wait_for_completion.return_value
+
+    async def wait_for_completion(transcription_id, max_wait):
+        calls.append(max_wait)
+        if len(calls) == 1:
+            # Stall for most of the allowance, then lose the connection
+            clock[0] += WAIT_MAX_SECONDS - 600
+            raise httpx.ReadError("stream dropped")
+        return completed
+
+    mock_client.wait_for_completion = wait_for_completion
+    processor = JobProcessor(frontend_client=mock_client)
+    with patch("emailer.job_processor.time.monotonic", side_effect=lambda: clock[0]), \
+            patch("emailer.job_processor.asyncio.sleep", new_callable=AsyncMock):
+        result = await processor.process_url("https://youtu.be/a")
+
+    assert result.success is True
+    assert calls == [WAIT_MAX_SECONDS, 600]
+
+
+@pytest.mark.asyncio
+async def test_wait_retry_after_deadline_times_out():
+    """Test that no retry is attempted once the overall wait deadline has passed."""
+    from emailer.frontend_client import WAIT_MAX_SECONDS
+
+    clock = [1000.0]
+    calls = []
+
+    async def wait_for_completion(transcription_id, max_wait):
+        calls.append(max_wait)
+        clock[0] += WAIT_MAX_SECONDS + 1
+        raise httpx.ReadError("stream dropped")
+
+    mock_client = _completed_frontend()
+    mock_client.wait_for_completion = wait_for_completion
+    processor = JobProcessor(frontend_client=mock_client)
+    with patch("emailer.job_processor.time.monotonic", side_effect=lambda: clock[0]), \
+            patch("emailer.job_processor.asyncio.sleep", new_callable=AsyncMock):
+        result = await processor.process_url("https://youtu.be/a")
+
+    assert result.success is False
+    assert "did not complete" in result.error
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_process_url_does_not_retry_client_errors():
+    """Test that 4xx responses are not retried."""
+    response = httpx.Response(
+        400, text="Bad Request", request=httpx.Request("POST", "http://localhost/api/transcribe")
+    )
+    mock_client = AsyncMock()
+    mock_client.submit_url = AsyncMock(
+        side_effect=httpx.HTTPStatusError("Bad Request", request=response.request, response=response)
+    )
+
+    processor = JobProcessor(frontend_client=mock_client)
+    result = await processor.process_url("invalid-url")
+
+    assert result.success is False
+    assert mock_client.submit_url.call_count == 1
+
+
+def _completed_frontend():
+    mock_client = AsyncMock()
+    mock_client.submit_url = AsyncMock(return_value="id_1")
+    mock_client.wait_for_completion = AsyncMock(
+        return_value=TranscriptionResult(transcription_id="id_1", status="completed", title="T")
+    )
+    mock_client.get_transcript_text = AsyncMock(return_value="text")
+    mock_client.generate_summary = AsyncMock(return_value="summary")
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_process_url_reruns_resubmitted_url():
+    """Test that a re-sent URL is submitted again rather than served from memory."""
+    mock_client = _completed_frontend()
+    processor = JobProcessor(frontend_client=mock_client)
+
+    await processor.process_url("https://youtu.be/a", tag="podcast")
+    await processor.process_url("https://youtu.be/a", tag="podcast")
+
+    assert mock_client.submit_url.call_count == 2
+    assert mock_client.generate_summary.call_count == 2
@@ -6,6 +6,17 @@ from emailer.imap_client import EmailMessage
 from emailer.main import EmailerService
 
 
+def _process_urls_returning(results):
+    """Mock JobProcessor.process_urls that reports each result as it 'finishes'."""
+    async def process_urls(urls, tag=None, on_result=None):
+        for result in results:
+            if on_result is not None:
+                await on_result(result)
+        return results
+
+    return AsyncMock(side_effect=process_urls)
+
+
 class TestEmailerService:
     """Tests for EmailerService."""
 
@@ -54,15 +65,17 @@ class TestEmailerService:
         service.processor.frontend = AsyncMock()
         service.processor.frontend.get_tags = AsyncMock(return_value=set())
         service.processor.frontend.get_tag_config = AsyncMock(return_value=None)
-        service.processor.process_url = AsyncMock(
-            return_value=JobResult(
-                url="https://youtube.com/watch?v=abc123",
-                success=True,
-                title="Test Video",
-                summary="Summary text",
-                transcript="Transcript text",
-                duration_seconds=120,
-            )
+        service.processor.process_urls = _process_urls_returning(
+            [
+                JobResult(
+                    url="https://youtube.com/watch?v=abc123",
+                    success=True,
+                    title="Test Video",
+                    summary="Summary text",
+                    transcript="Transcript text",
+                    duration_seconds=120,
+                )
+            ]
         )
 
         email = EmailMessage(
@@ -73,21 +86,21 @@ class TestEmailerService:
             body_html=None,
         )
 
-        await service._process_email(email)
+        target = await service._process_email(email)
 
         # Should have processed the URL with default tag (no match in subject)
-        service.processor.process_url.assert_called_once_with(
-            "https://youtube.com/watch?v=abc123", tag="email"
-        )
+        service.processor.process_urls.assert_called_once()
+        assert service.processor.process_urls.call_args.args == (["https://youtube.com/watch?v=abc123"],)
+        assert service.processor.process_urls.call_args.kwargs["tag"] == "email"
 
         # Should have sent success email (to sender since no tag destination)
         service.smtp.send_email.assert_called()
         call_args = service.smtp.send_email.call_args
-        assert call_args.kwargs["to_addr"] == "user@example.com"
+        assert call_args.kwargs["to_addr"] == ["user@example.com"]
         assert "[Scribe]" in call_args.kwargs["subject"]
 
-        # Should have moved to done folder
-        service.imap.move_to_folder.assert_called_with("123", "ScribeDone")
+        # Should be filed in done folder
+        assert target == "ScribeDone"
 
     @pytest.mark.asyncio
     async def test_process_email_no_urls(self, mock_settings):
@@ -108,7 +121,7 @@ class TestEmailerService:
             body_html=None,
         )
 
-        await service._process_email(email)
+        target = await service._process_email(email)
 
         # Should have sent error email to sender
         service.smtp.send_email.assert_called()
@@ -116,8 +129,8 @@ class TestEmailerService:
         assert call_args.kwargs["to_addr"] == "user@example.com"
         assert "No transcribable URLs" in call_args.kwargs["subject"]
 
-        # Should have moved to error folder
-        service.imap.move_to_folder.assert_called_with("123", "ScribeError")
+        # Should be filed in error folder
+        assert target == "ScribeError"
 
     @pytest.mark.asyncio
     async def test_process_email_partial_failure(self, mock_settings):
@@ -136,8 +149,8 @@ class TestEmailerService:
         service.processor.frontend.get_tag_config = AsyncMock(return_value=None)
 
         # First URL succeeds, second fails
-        service.processor.process_url = AsyncMock(
-            side_effect=[
+        service.processor.process_urls = _process_urls_returning(
+            [
                 JobResult(
                     url="https://youtube.com/watch?v=abc",
                     success=True,
@@ -162,14 +175,14 @@ class TestEmailerService:
             body_html=None,
         )
 
-        await service._process_email(email)
+        target = await service._process_email(email)
 
         # Should have sent success email for first URL
         # Should have sent error email for second URL
         assert service.smtp.send_email.call_count == 2
 
-        # Should have moved to done folder (partial success)
-        service.imap.move_to_folder.assert_called_with("123", "ScribeDone")
+        # Should be filed in done folder (partial success)
+        assert target == "ScribeDone"
 
     @pytest.mark.asyncio
     async def test_process_email_resolves_tag_from_subject(self, mock_settings):
@@ -193,15 +206,17 @@ class TestEmailerService:
             return_value={"podcast", "interview"}
         )
         service.processor.frontend.get_tag_config = AsyncMock(return_value=None)
-        service.processor.process_url = AsyncMock(
-            return_value=JobResult(
-                url="https://example.com/audio.mp3",
-                success=True,
-                title="Test Audio",
-                summary="Summary text",
-                transcript="Transcript text",
-                duration_seconds=100,
-            )
+        service.processor.process_urls = _process_urls_returning(
+            [
+                JobResult(
+                    url="https://example.com/audio.mp3",
+                    success=True,
+                    title="Test Audio",
+                    summary="Summary text",
+                    transcript="Transcript text",
+                    duration_seconds=100,
+                )
+            ]
         )
 
         email = EmailMessage(
@@ -218,10 +233,42 @@ class TestEmailerService:
         service.processor.frontend.get_tags.assert_called_once()
 
         # Verify submit_url was called with resolved tag "podcast"
-        service.processor.process_url.assert_called_once_with(
-            "https://example.com/audio.mp3", tag="podcast"
+        service.processor.process_urls.assert_called_once()
+        assert service.processor.process_urls.call_args.args == (["https://example.com/audio.mp3"],)
+        assert service.processor.process_urls.call_args.kwargs["tag"] == "podcast"
+
+    @pytest.mark.asyncio
+    async def test_process_email_extracts_urls_off_event_loop(self, mock_settings):
+        """Test that URL extraction (HTML parsing) runs in a worker thread."""
+        import threading
+        from emailer import main as main_mod
+
+        service = EmailerService(mock_settings)
+        service.smtp = AsyncMock()
+
+        loop_thread = threading.get_ident()
+        extract_threads = []
+        real_extract = main_mod.extract_urls
+
+        def recording_extract(*args, **kwargs):
+            extract_threads.append(threading.get_ident())
+            return real_extract(*args, **kwargs)
+
+        email = EmailMessage(
+            msg_num="123",
+            sender="user@example.com",
+            subject="Hello",
+            body_text="See below",
+            body_html='<a href="https://example.com">no media here</a>',
         )
 
+        with patch("emailer.main.extract_urls", side_effect=recording_extract):
+            target = await service._process_email(email)
+
+        assert len(extract_threads) == 2
+        assert loop_thread not in extract_threads
+        assert target == "ScribeError"
+
 
 class TestSendResultEmail:
     """Tests for _send_result_email destination resolution."""
@@ -284,7 +331,7 @@ class TestSendResultEmail:
         # Verify email was sent to tag's destination
         service.smtp.send_email.assert_called_once()
         call_kwargs = service.smtp.send_email.call_args
-        assert call_kwargs.kwargs["to_addr"] == "kindle@example.com"
+        assert call_kwargs.kwargs["to_addr"] == ["kindle@example.com"]
 
     @pytest.mark.asyncio
     async def test_uses_sender_when_tag_destination_not_set(self, mock_settings):
@@ -315,7 +362,7 @@ class TestSendResultEmail:
         # Verify email was sent to sender (fallback)
         service.smtp.send_email.assert_called_once()
         call_kwargs = service.smtp.send_email.call_args
-        assert call_kwargs.kwargs["to_addr"] == "user@test.com"
+        assert call_kwargs.kwargs["to_addr"] == ["user@test.com"]
 
     @pytest.mark.asyncio
     async def test_uses_sender_when_no_tag_config(self, mock_settings):
@@ -341,7 +388,7 @@ class TestSendResultEmail:
         # Verify email was sent to sender (fallback)
         service.smtp.send_email.assert_called_once()
         call_kwargs = service.smtp.send_email.call_args
-        assert call_kwargs.kwargs["to_addr"] == "user@test.com"
+        assert call_kwargs.kwargs["to_addr"] == ["user@test.com"]
 
     @pytest.mark.asyncio
     async def test_sends_to_multiple_destination_emails(self, mock_settings):
@@ -369,10 +416,9 @@ class TestSendResultEmail:
 
         await service._send_result_email(mock_email, result, tag_config=tag_config)
 
-        # Verify email was sent to all destinations
-        assert service.smtp.send_email.call_count == 3
-        call_args_list = service.smtp.send_email.call_args_list
-        recipients = [call.kwargs["to_addr"] for call in call_args_list]
+        # Verify one email was sent to all destinations
+        service.smtp.send_email.assert_called_once()
+        recipients = service.smtp.send_email.call_args.kwargs["to_addr"]
         assert recipients == ["alice@example.com", "bob@example.com", "carol@example.com"]
 
     @pytest.mark.asyncio
@@ -449,7 +495,7 @@ class TestEpisodeSourceProcessing:
         from emailer.job_processor import JobResult
 
         service = EmailerService(mock_settings)
-        service.imap = AsyncMock()
+        service.episode_imap = AsyncMock()
         service.smtp = AsyncMock()
         service.smtp.send_email = AsyncMock()
 
@@ -473,7 +519,7 @@ class TestEpisodeSourceProcessing:
             body_html=None,
         )
 
-        await service._process_episode_source_email(email)
+        target = await service._process_episode_source_email(email)
 
         # Should have sent result to configured return address
         service.smtp.send_email.assert_called()
@@ -481,8 +527,8 @@ class TestEpisodeSourceProcessing:
         assert call_kwargs["to_addr"] == "newsletters@test.com"
         assert "Scribe: New Episode: Testing" in call_kwargs["subject"]
 
-        # Should move to done folder
-        service.imap.move_to_folder.assert_called_with("1", "EpisodeSourcesDone")
+        # Should be filed in done folder
+        assert target == "EpisodeSourcesDone"
 
     @pytest.mark.asyncio
     async def test_process_episode_source_email_no_urls(self, mock_settings):
@@ -490,7 +536,7 @@ class TestEpisodeSourceProcessing:
         from emailer.job_processor import JobResult
 
         service = EmailerService(mock_settings)
-        service.imap = AsyncMock()
+        service.episode_imap = AsyncMock()
         service.smtp = AsyncMock()
         service.smtp.send_email = AsyncMock()
 
@@ -511,32 +557,196 @@ class TestEpisodeSourceProcessing:
             body_html=None,
         )
 
-        await service._process_episode_source_email(email)
+        target = await service._process_episode_source_email(email)
 
         # Should notify sender
         service.smtp.send_email.assert_called()
         call_kwargs = service.smtp.send_email.call_args.kwargs
         assert call_kwargs["to_addr"] == "user@example.com"
 
-        # Should move to error folder
-        service.imap.move_to_folder.assert_called_with("2", "EpisodeSourcesError")
+        # Should be filed in error folder
+        assert target == "EpisodeSourcesError"
 
     @pytest.mark.asyncio
-    async def test_poll_checks_episode_sources_folder(self, mock_settings):
-        """Test that polling checks both ToScribe and EpisodeSources folders."""
+    async def test_start_watches_each_folder_on_its_own_session(self, mock_settings):
+        """Test that ToScribe and EpisodeSources are polled by independent loops."""
         import asyncio
+        mock_settings.poll_interval_seconds = 0.01
         service = EmailerService(mock_settings)
-        service.imap = AsyncMock()
+        service.imap = AsyncMock(supports_idle=False)
+        service.episode_imap = AsyncMock(supports_idle=False)
         service.smtp = AsyncMock()
-        service.semaphore = asyncio.Semaphore(3)
-
-        # No emails in either folder
         service.imap.fetch_unseen = AsyncMock(return_value=[])
+        service.episode_imap.fetch_unseen = AsyncMock(return_value=[])
+
+        with patch("emailer.main.aclose_redirect_client", new_callable=AsyncMock) as mock_aclose:
+            task = asyncio.create_task(service.start())
+            await asyncio.sleep(0.05)
+            await service.stop()
+            await asyncio.wait_for(task, timeout=1)
+
+        mock_aclose.assert_awaited_once()
+        assert {c.args for c in service.imap.fetch_unseen.call_args_list} == {("ToScribe",)}
+        assert {c.args for c in service.episode_imap.fetch_unseen.call_args_list} == {("EpisodeSources",)}
+        service.imap.disconnect.assert_awaited_once()
+        service.episode_imap.disconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_poll_folder_dispatches_emails_to_bounded_workers(self, mock_settings):
+        """Test that polled emails run on at most max_concurrent_jobs workers."""
+        import asyncio
+        service = EmailerService(mock_settings)
+        service.imap = AsyncMock()
+        service.episode_imap = AsyncMock()
+        service._start_workers()
+        assert len(service._workers) == 3
+
+        inbox_emails = [
+            EmailMessage(msg_num=str(i), sender="a@example.com", subject="", body_text="", body_html=None)
+            for i in range(5)
+        ]
+        es_email = EmailMessage(msg_num="9", sender="b@example.com", subject="", body_text="", body_html=None)
+        service.imap.fetch_unseen = AsyncMock(return_value=inbox_emails)
+        service.episode_imap.fetch_unseen = AsyncMock(return_value=[es_email])
+
+        active = 0
+        peak = 0
+        processed = []
+
+        async def fake_process(email):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            processed.append(email.msg_num)
+            if email.msg_num == "0":
+                raise RuntimeError("boom")
+
+        await asyncio.gather(
+            service._poll_folder(service.imap, "ToScribe", fake_process),
+            service._poll_folder(service.episode_imap, "EpisodeSources", fake_process),
+        )
+
+        # Polls return only after their emails are handled, errors included
+        assert sorted(processed) == ["0", "1", "2", "3", "4", "9"]
+        assert peak == 3
+        service.imap.mark_seen_many.assert_awaited_once_with(["0", "1", "2", "3", "4"])
+        service.episode_imap.mark_seen_many.assert_awaited_once_with(["9"])
+        await service._stop_workers()
+        assert service._workers == []
+
+    @pytest.mark.asyncio
+    async def test_poll_folder_moves_batch_once_per_target_folder(self, mock_settings):
+        """Test that processed emails are moved together after the batch finishes."""
+        service = EmailerService(mock_settings)
+        service.imap = AsyncMock()
+        service.imap.fetch_unseen = AsyncMock(return_value=[
+            EmailMessage(msg_num=n, sender="a@example.com", subject="", body_text="", body_html=None)
+            for n in ("1", "2", "3", "4")
+        ])
+        targets = {"1": "ScribeDone", "2": "ScribeError", "3": "ScribeDone", "4": None}
+
+        async def fake_process(email):
+            assert not service.imap.move_many.called
+            return targets[email.msg_num]
+
+        service._start_workers()
+        await service._poll_folder(service.imap, "ToScribe", fake_process)
+        await service._stop_workers()
+
+        service.imap.move_many.assert_awaited_once_with(
+            "ToScribe", {"ScribeDone": ["1", "3"], "ScribeError": ["2"]}
+        )
+        service.imap.move_to_folder.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_poll_folder_reconnects_only_its_session(self, mock_settings):
+        """Test that a dropped connection reconnects just the failing folder's session."""
+        service = EmailerService(mock_settings)
+        service.imap = AsyncMock()
+        service.imap.is_connection_error = MagicMock(return_value=True)
+        service.imap.fetch_unseen = AsyncMock(side_effect=OSError("socket error: EOF"))
+        service._start_workers()
+
+        await service._poll_folder(service.imap, "ToScribe", AsyncMock())
+        await service._stop_workers()
+
+        service.imap.reconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_new_mail_returns_when_idle_reports_mail(self, mock_settings):
+        """Test that IDLE reporting new mail wakes the folder loop."""
+        import asyncio
+        service = EmailerService(mock_settings)
+        service._shutdown_event = asyncio.Event()
+        imap = MagicMock(supports_idle=True)
+        imap.idle = AsyncMock(return_value=True)
+
+        await asyncio.wait_for(service._wait_for_new_mail(imap, "ToScribe"), timeout=1)
+
+        imap.idle.assert_awaited_once_with("ToScribe")
+        imap.stop_idle.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_new_mail_stops_idle_on_shutdown(self, mock_settings):
+        """Test that shutdown ends a running IDLE."""
+        import asyncio
+        service = EmailerService(mock_settings)
+        service._shutdown_event = asyncio.Event()
+        stopped = asyncio.Event()
+
+        async def quiet_idle(folder):
+            await stopped.wait()
+            return False
+
+        imap = MagicMock(supports_idle=True)
+        imap.idle = quiet_idle
+        imap.stop_idle = MagicMock(side_effect=stopped.set)
+
+        wait = asyncio.create_task(service._wait_for_new_mail(imap, "EpisodeSources"))
+        await asyncio.sleep(0)
+        service._shutdown_event.set()
+        await asyncio.wait_for(wait, timeout=1)
+
+        imap.stop_idle.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_new_mail_polls_without_idle_support(self, mock_settings):
+        """Test that servers without IDLE fall back to the poll interval."""
+        import asyncio
+        mock_settings.poll_interval_seconds = 0.01
+        service = EmailerService(mock_settings)
+        service._shutdown_event = asyncio.Event()
+        imap = MagicMock(supports_idle=False)
+        imap.idle = AsyncMock()
+
+        await asyncio.wait_for(service._wait_for_new_mail(imap, "ToScribe"), timeout=1)
+
+        imap.idle.assert_not_awaited()
+
+
+class TestRun:
+    """Tests for the service entry point."""
+
+    def test_run_uses_uvloop_when_installed(self):
+        """Test that run() hands main() to uvloop when it is importable."""
+        import sys
+        fake_uvloop = MagicMock()
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}), \
+             patch("emailer.main.main", MagicMock(return_value="coro")):
+            from emailer.main import run
+            run()
+
+        fake_uvloop.run.assert_called_once_with("coro")
 
-        await service._poll_and_process()
+    def test_run_falls_back_to_asyncio(self):
+        """Test that run() uses asyncio.run when uvloop is not installed."""
+        import sys
+        with patch.dict(sys.modules, {"uvloop": None}), \
+             patch("emailer.main.main", MagicMock(return_value="coro")), \
+             patch("emailer.main.asyncio.run") as mock_run:
+            from emailer.main import run
+            run()
 
-        # Should have checked both folders
-        calls = service.imap.fetch_unseen.call_args_list
-        folders_checked = [call.args[0] for call in calls]
-        assert "ToScribe" in folders_checked
-        assert "EpisodeSources" in folders_checked
+        mock_run.assert_called_once_with("coro")
@@ -1,7 +1,10 @@
 """Tests for SMTP client."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch
+from aiosmtplib import SMTPServerDisconnected
 from emailer.smtp_client import SmtpClient
 
 
@@ -42,6 +45,7 @@ class TestSmtpClient:
             assert msg["Subject"] == "Test Subject"
             assert msg["From"] == "from@test.com"
             assert msg["To"] == "to@test.com"
+            assert call_args.kwargs["recipients"] == ["to@test.com"]
 
     @pytest.mark.asyncio
     async def test_send_email_without_tls(self):
@@ -111,3 +115,149 @@ class TestSmtpClient:
             content_types = [part.get_content_type() for part in parts]
             assert "text/plain" in content_types
             assert "text/html" in content_types
+
+    @pytest.mark.asyncio
+    async def test_send_email_to_multiple_recipients_in_one_transaction(self):
+        """Test that a recipient list is sent as a single message."""
+        with patch("emailer.smtp_client.SMTP") as mock_smtp:
+            mock_instance = AsyncMock()
+            mock_smtp.return_value = mock_instance
+
+            client = SmtpClient(
+                host="smtp.test.com",
+                port=587,
+                user="test@test.com",
+                password="testpass",
+                use_tls=True,
+            )
+
+            await client.send_email(
+                from_addr="from@test.com",
+                to_addr=["a@test.com", "b@test.com"],
+                subject="Test",
+                body="Body",
+            )
+
+            mock_instance.connect.assert_awaited_once()
+            mock_instance.send_message.assert_awaited_once()
+            call_args = mock_instance.send_message.call_args
+            # Recipients don't see each other's addresses
+            assert call_args[0][0]["To"] == "undisclosed-recipients:;"
+            assert "a@test.com" not in call_args[0][0].as_string()
+            assert call_args.kwargs["recipients"] == ["a@test.com", "b@test.com"]
+
+    @pytest.mark.asyncio
+    async def test_reuses_session_across_sends(self):
+        """Test that consecutive sends share one connection and login."""
+        with patch("emailer.smtp_client.SMTP") as mock_smtp:
+            mock_instance = AsyncMock()
+            mock_instance.is_connected = True
+            mock_smtp.return_value = mock_instance
+
+            client = SmtpClient(
+                host="smtp.test.com", port=587, user="u", password="p", use_tls=True
+            )
+            for to_addr in ("a@test.com", "b@test.com"):
+                await client.send_email(
+                    from_addr="from@test.com", to_addr=to_addr, subject="S", body="B"
+                )
+
+            mock_smtp.assert_called_once()
+            mock_instance.login.assert_awaited_once_with("u", "p")
+            assert mock_instance.send_message.await_count == 2
+            mock_instance.quit.assert_not_awaited()
+
+            await client.disconnect()
+            mock_instance.quit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_when_server_drops_session(self):
+        """Test that a dropped session is reopened and the send retried."""
+        with patch("emailer.smtp_client.SMTP") as mock_smtp:
+            stale = AsyncMock()
+            stale.is_connected = True
+            stale.send_message = AsyncMock(side_effect=SMTPServerDisconnected("gone"))
+            fresh = AsyncMock()
+            fresh.is_connected = True
+            mock_smtp.side_effect = [stale, fresh]
+
+            client = SmtpClient(
+                host="smtp.test.com", port=587, user="u", password="p", use_tls=True
+            )
+            await client.send_email(
+                from_addr="from@test.com", to_addr="to@test.com", subject="S", body="B"
+            )
+
+            assert mock_smtp.call_count == 2
+            fresh.login.assert_awaited_once()
+            fresh.send_message.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pool_sends_concurrently_on_separate_sessions(self):
+        """Test that concurrent sends use up to pool_size sessions in parallel."""
+        with patch("emailer.smtp_client.SMTP") as mock_smtp:
+            release = asyncio.Event()
+            in_flight = 0
+            peak = 0
+
+            async def slow_send(msg, recipients):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await release.wait()
+                in_flight -= 1
+
+            sessions = []
+
+            def new_session(**kwargs):
+                session = AsyncMock()
+                session.is_connected = True
+                session.send_message = AsyncMock(side_effect=slow_send)
+                sessions.append(session)
+                return session
+
+            mock_smtp.side_effect = new_session
+
+            client = SmtpClient(
+                host="smtp.test.com", port=587, user="u", password="p",
+                use_tls=True, pool_size=2,
+            )
+            sends = [
+                asyncio.create_task(
+                    client.send_email(from_addr="f@test.com", to_addr=f"{i}@test.com", subject="S", body="B")
+                )
+                for i in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            assert peak == 2
+            release.set()
+            await asyncio.gather(*sends)
+
+            assert len(sessions) == 2
+            assert sum(s.send_message.await_count for s in sessions) == 3
+
+    @pytest.mark.asyncio
+    async def test_replaces_session_idle_past_ttl(self):
+        """Test that a session idle longer than the TTL is closed and reopened."""
+        from emailer.smtp_client import SESSION_IDLE_TTL_SECONDS
+
+        with patch("emailer.smtp_client.SMTP") as mock_smtp, \
+             patch("emailer.smtp_client.time.monotonic") as mock_monotonic:
+            old, new = AsyncMock(is_connected=True), AsyncMock(is_connected=True)
+            mock_smtp.side_effect = [old, new]
+            mock_monotonic.return_value = 1000.0
+
+            client = SmtpClient(
+                host="smtp.test.com", port=587, user="u", password="p", use_tls=True
+            )
+            await client.send_email(from_addr="f@test.com", to_addr="a@test.com", subject="S", body="B")
+            mock_monotonic.return_value = 1000.0 + SESSION_IDLE_TTL_SECONDS / 2
+            await client.send_email(from_addr="f@test.com", to_addr="a@test.com", subject="S", body="B")
+            assert mock_smtp.call_count == 1
+
+            mock_monotonic.return_value += SESSION_IDLE_TTL_SECONDS + 1
+            await client.send_email(from_addr="f@test.com", to_addr="a@test.com", subject="S", body="B")
+
+            assert mock_smtp.call_count == 2
+            old.quit.assert_awaited_once()
+            new.send_message.assert_awaited_once()
@@ -37,6 +37,10 @@ class TestIsTranscribableUrl:
     def test_non_transcribable_image_url(self):
         assert not is_transcribable_url("https://example.com/image.jpg")
 
+    def test_patterns_are_case_insensitive(self):
+        assert is_transcribable_url("https://YOUTU.BE/abc123")
+        assert is_transcribable_url("https://example.com/AUDIO.MP3")
+
 
 class TestExtractUrls:
     """Tests for URL extraction from email content."""
@@ -53,7 +57,10 @@ class TestExtractUrls:
         https://youtu.be/def456
         """
         urls = extract_urls(body)
-        assert len(urls) == 2
+        assert urls == [
+            "https://www.youtube.com/watch?v=abc123",
+            "https://youtu.be/def456",
+        ]
         assert "https://www.youtube.com/watch?v=abc123" in urls
         assert "https://youtu.be/def456" in urls
 
@@ -68,6 +75,18 @@ class TestExtractUrls:
         urls = extract_urls(body, is_html=True)
         assert urls == ["https://www.youtube.com/watch?v=abc123"]
 
+    def test_extract_from_html_hrefs_and_text(self):
+        body = """
+        <p><a href="https://youtu.be/abc123">Watch</a></p>
+        <p>Listen at https://example.com/episode.mp3.</p>
+        <a>no href</a>
+        """
+        urls = extract_urls(body, is_html=True)
+        assert urls == [
+            "https://youtu.be/abc123",
+            "https://example.com/episode.mp3",
+        ]
+
     def test_deduplicate_urls(self):
         body = """
         https://www.youtube.com/watch?v=abc123
@@ -90,3 +109,13 @@ class TestExtractUrls:
     def test_no_urls_returns_empty_list(self):
         body = "No URLs here, just text."
         assert extract_urls(body) == []
+
+    def test_seen_urls_are_skipped(self):
+        body = """
+        <a href="https://youtu.be/abc123">Watch</a>
+        https://youtu.be/abc123 and https://youtu.be/def456
+        """
+        urls = extract_urls(
+            body, is_html=True, seen={"https://youtu.be/abc123"}
+        )
+        assert urls == ["https://youtu.be/def456"]
@@ -29,6 +29,14 @@ class TranscriptionResponse(BaseModel):
     source_context: Optional[str] = None
 
 
+class TranscriptionStatusResponse(BaseModel):
+    """Lightweight status for polling a transcription job."""
+    id: str
+    status: str
+    progress: int = 0
+    error: Optional[str] = None
+
+
 class UpdateTagsRequest(BaseModel):
     """Request to update transcription tags."""
     tags: List[str] = Field(..., description="Tags to set (replaces existing)")
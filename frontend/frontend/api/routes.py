@@ -1,10 +1,11 @@
 """API routes for frontend service."""
 
+import asyncio
 import json
 import logging
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
 from fastapi.encoders import jsonable_encoder
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
@@ -15,6 +16,7 @@ from frontend.api.models import (
     TranscribeRequest,
     TranscriptionResponse,
     TranscriptionListResponse,
+    TranscriptionStatusResponse,
     ErrorResponse,
     UpdateTagsRequest,
     SummaryRequest,
@@ -30,7 +32,7 @@ from frontend.api.models import (
     EpisodeSourceRequest,
     EpisodeSourceResponse,
 )
-from frontend.core.database import get_db
+from frontend.core.database import get_db, get_session_maker
 from frontend.core.models import Transcription, Summary, EpisodeSource
 from frontend.services.orchestrator import Orchestrator
 from frontend.services.summarizer import SummarizerService
@@ -42,6 +44,10 @@ from frontend.utils.tag_validator import normalize_tags
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["api"])
+
+# Server-sent event stream tuning for /transcriptions/{id}/events
+EVENT_POLL_INTERVAL_SECONDS = 1.0
+EVENT_KEEPALIVE_SECONDS = 15.0
 web_router = APIRouter(tags=["web"])
 
 template_dir = Path(__file__).parent.parent / "web" / "templates"
@@ -245,6 +251,22 @@ async def get_transcription(transcription_id: str, db: Session = Depends(get_db)
     return TranscriptionResponse(**transcription.to_dict())
 
 
+@router.get("/transcriptions/{transcription_id}/status", response_model=TranscriptionStatusResponse)
+async def get_transcription_status(transcription_id: str, db: Session = Depends(get_db)):
+    """Get only the status and progress of a transcription, for cheap polling."""
+    transcription = db.query(Transcription).filter_by(id=transcription_id).first()
+
+    if not transcription:
+        raise HTTPException(status_code=404, detail="Transcription not found")
+
+    return TranscriptionStatusResponse(
+        id=transcription.id,
+        status=transcription.status,
+        progress=transcription.progress or 0,
+        error=transcription.error_message,
+    )
+
+
 @router.patch(
     "/transcriptions/{transcription_id}",
     response_model=TranscriptionResponse,
@@ -359,6 +381,68 @@ async def export_transcription(
         raise HTTPException(status_code=400, detail="Invalid format. Use txt, srt, or json")
 
 
+@router.get("/transcriptions/{transcription_id}/events")
+async def stream_transcription_events(
+    transcription_id: str,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """
+    Stream transcription status changes as server-sent events.
+
+    Sends a `data:` frame whenever the status or progress changes and closes
+    the stream once the transcription is completed or failed. Comment frames
+    are sent periodically so idle connections are not timed out.
+    """
+    transcription = db.query(Transcription).filter_by(id=transcription_id).first()
+
+    if not transcription:
+        raise HTTPException(status_code=404, detail="Transcription not found")
+
+    async def event_stream():
+        # The request's session is closed once the handler returns, before
+        # the body is streamed, so the generator polls with its own session.
+        session = get_session_maker()()
+        last_state = None
+        last_sent = asyncio.get_running_loop().time()
+        try:
+            while True:
+                session.expire_all()
+                current = session.query(Transcription).filter_by(id=transcription_id).first()
+                if not current:
+                    return
+
+                state = (current.status, current.progress)
+                now = asyncio.get_running_loop().time()
+                if state != last_state:
+                    last_state = state
+                    last_sent = now
+                    event = {
+                        "id": current.id,
+                        "status": current.status,
+                        "progress": current.progress,
+                        "error": current.error_message,
+                    }
+                    yield f"data: {json.dumps(event)}\n\n"
+                elif now - last_sent >= EVENT_KEEPALIVE_SECONDS:
+                    last_sent = now
+                    yield ": keep-alive\n\n"
+
+                if current.status in ("completed", "failed"):
+                    return
+                if await request.is_disconnected():
+                    return
+                await asyncio.sleep(EVENT_POLL_INTERVAL_SECONDS)
+        finally:
+            session.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 # =============================================================================
 # Summary API Endpoints
 # =============================================================================
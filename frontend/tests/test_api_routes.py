@@ -24,12 +24,15 @@ def test_db():
 
 
 @pytest.fixture
-def test_app(test_db):
+def test_app(test_db, monkeypatch):
     """Create test FastAPI app without lifespan"""
+    from frontend.api import routes
+
     app = FastAPI()
     app.include_router(api_router)
 
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_db)
+    monkeypatch.setattr(routes, 'get_session_maker', lambda: TestingSessionLocal)
 
     def override_get_db():
         try:
@@ -459,3 +462,118 @@ def test_get_transcription_source_context_null_when_missing(client, db_session):
     assert response.status_code == 200
     data = response.json()
     assert data["source_context"] is None
+
+
+def test_transcription_events_streams_until_terminal(client, db_session):
+    """Test that the events stream emits status and closes on completion."""
+    import json
+    from frontend.core.models import Transcription
+
+    transcription = Transcription(
+        id="test_events_done",
+        source_type="youtube",
+        source_url="https://youtube.com/watch?v=events",
+        status="completed",
+        progress=100,
+    )
+    db_session.add(transcription)
+    db_session.commit()
+
+    response = client.get("/api/transcriptions/test_events_done/events")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    frames = [line for line in response.text.splitlines() if line.startswith("data: ")]
+    assert len(frames) == 1
+    event = json.loads(frames[0][len("data: "):])
+    assert event["id"] == "test_events_done"
+    assert event["status"] == "completed"
+    assert event["progress"] == 100
+
+
+def test_transcription_events_closes_stream_session(client, db_session, test_db, monkeypatch):
+    """Test that the events stream polls with its own session and closes it."""
+    import json
+    from sqlalchemy.orm import Session
+    from frontend.api import routes
+    from frontend.core.models import Transcription
+
+    transcription = Transcription(
+        id="test_events_session",
+        source_type="youtube",
+        source_url="https://youtube.com/watch?v=session",
+        status="processing",
+        progress=40,
+    )
+    db_session.add(transcription)
+    db_session.commit()
+
+    polls = []
+    closed = []
+
+    class TrackingSession(Session):
+        def expire_all(self):
+            polls.append(self)
+            if len(polls) == 2:
+                # Finish the job between the first and second poll
+                row = db_session.query(Transcription).filter_by(id="test_events_session").first()
+                row.status = "completed"
+                row.progress = 100
+                db_session.commit()
+            super().expire_all()
+
+        def close(self):
+            closed.append(self)
+            super().close()
+
+    monkeypatch.setattr(routes, 'EVENT_POLL_INTERVAL_SECONDS', 0)
+    monkeypatch.setattr(
+        routes, 'get_session_maker',
+        lambda: sessionmaker(autocommit=False, autoflush=False, bind=test_db, class_=TrackingSession)
+    )
+
+    response = client.get("/api/transcriptions/test_events_session/events")
+    assert response.status_code == 200
+
+    frames = [line for line in response.text.splitlines() if line.startswith("data: ")]
+    statuses = [json.loads(frame[len("data: "):])["status"] for frame in frames]
+    assert statuses == ["processing", "completed"]
+    assert len(set(map(id, polls))) == 1
+    assert closed == [polls[0]]
+
+
+def test_transcription_events_not_found(client):
+    """Test that the events stream returns 404 for unknown transcriptions."""
+    response = client.get("/api/transcriptions/missing/events")
+    assert response.status_code == 404
+
+
+def test_get_transcription_status(client, db_session):
+    """Test that the status endpoint returns only status fields."""
+    from frontend.core.models import Transcription
+
+    transcription = Transcription(
+        id="test_status_only",
+        source_type="youtube",
+        source_url="https://youtube.com/watch?v=status",
+        status="transcribing",
+        progress=40,
+        source_context="Large email body",
+    )
+    db_session.add(transcription)
+    db_session.commit()
+
+    response = client.get("/api/transcriptions/test_status_only/status")
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": "test_status_only",
+        "status": "transcribing",
+        "progress": 40,
+        "error": None,
+    }
+
+
+def test_get_transcription_status_not_found(client):
+    """Test that the status endpoint returns 404 for unknown transcriptions."""
+    response = client.get("/api/transcriptions/missing/status")
+    assert response.status_code == 404